@@ -0,0 +1,84 @@
+"""
+Import time benchmark. Measures ``import intercept_it`` in fresh interpreters
+and checks that heavy third-party dependencies are not imported eagerly.
+
+Usage::
+
+    python benchmarks/import_time.py --runs 20 --budget-ms 50
+
+Prints JSON report and exits with code 1 if any check fails
+"""
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules, which mustn't be imported until the loggers are used
+LAZY_DEPENDENCIES = ('loguru', 'pytz', 'pydantic')
+
+IMPORT_STATEMENTS = {
+    'package': 'import intercept_it',
+    'interceptors': 'from intercept_it import GlobalInterceptor, UnitInterceptor, LoopedInterceptor, NestedInterceptor',
+}
+
+PROBE = '''
+import sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(elapsed, ','.join(name for name in {dependencies!r} if name in sys.modules))
+'''
+
+
+def measure(statement: str, runs: int) -> dict:
+    timings = []
+    imported_dependencies = set()
+
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(statement=statement, dependencies=LAZY_DEPENDENCIES)],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.split()
+
+        timings.append(float(output[0]) * 1000)
+        if len(output) > 1:
+            imported_dependencies.update(output[1].split(','))
+
+    return {
+        'statement': statement,
+        'runs': runs,
+        'min_ms': round(min(timings), 3),
+        'median_ms': round(statistics.median(timings), 3),
+        'max_ms': round(max(timings), 3),
+        'imported_lazy_dependencies': sorted(imported_dependencies),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='Count of interpreters started for every statement')
+    parser.add_argument('--budget-ms', type=float, default=None, help='Maximum allowed median import time')
+    arguments = parser.parse_args()
+
+    results = {name: measure(statement, arguments.runs) for name, statement in IMPORT_STATEMENTS.items()}
+
+    failures = []
+    for name, result in results.items():
+        if result['imported_lazy_dependencies']:
+            failures.append(f'{name}: eagerly imported {", ".join(result["imported_lazy_dependencies"])}')
+        if arguments.budget_ms is not None and result['median_ms'] > arguments.budget_ms:
+            failures.append(f'{name}: median {result["median_ms"]} ms exceeds budget {arguments.budget_ms} ms')
+
+    print(json.dumps({'benchmark': 'import_time', 'results': results, 'failures': failures}, indent=2))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
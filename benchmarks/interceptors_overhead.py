@@ -0,0 +1,262 @@
+"""
+Interceptors overhead benchmark. Measures the happy path of every interceptor against the unwrapped call
+and the exception path with different count of loggers and handlers.
+
+Usage::
+
+    python benchmarks/interceptors_overhead.py --number 20000 --repeat 5 --output current.json
+    python benchmarks/interceptors_overhead.py --filter exception --compare current.json
+
+Prints JSON report. Timings are nanoseconds per call, the best and the median of the repeats
+"""
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from intercept_it import GlobalInterceptor, UnitInterceptor, LoopedInterceptor, NestedInterceptor  # noqa: E402
+from intercept_it.loggers.base_logger import BaseLogger, BaseAsyncLogger  # noqa: E402
+from intercept_it.utils import arguments_checker  # noqa: E402
+
+MANY = 5
+
+
+class NullLogger(BaseLogger):
+    def save_logs(self, message) -> None:
+        pass
+
+
+class NullAsyncLogger(BaseAsyncLogger):
+    async def save_logs(self, message) -> None:
+        pass
+
+
+def null_handler(*args, **kwargs) -> None:
+    pass
+
+
+async def null_async_handler(*args, **kwargs) -> None:
+    pass
+
+
+def target(number: int) -> int:
+    return number + 1
+
+
+async def async_target(number: int) -> int:
+    return number + 1
+
+
+def failing_target(number: int) -> int:
+    raise ValueError(number)
+
+
+async def async_failing_target(number: int) -> int:
+    raise ValueError(number)
+
+
+def run_sync(call: Callable, number: int) -> float:
+    started = time.perf_counter_ns()
+    for index in range(number):
+        call(index)
+    return (time.perf_counter_ns() - started) / number
+
+
+def run_async(call: Callable, number: int) -> float:
+    async def loop() -> float:
+        started = time.perf_counter_ns()
+        for index in range(number):
+            await call(index)
+        return (time.perf_counter_ns() - started) / number
+    return asyncio.run(loop())
+
+
+def setup_interceptor(interceptor_class: type, loggers: int = 0, handlers: int = 0, **parameters):
+    """ Creates interceptor with the null loggers and handlers """
+    async_mode = parameters.get('async_mode', False)
+    logger_class = NullAsyncLogger if async_mode else NullLogger
+    if interceptor_class is not UnitInterceptor:
+        parameters.setdefault('exceptions', [ValueError])
+
+    interceptor = interceptor_class(loggers=[logger_class() for _ in range(loggers)] or None, **parameters)
+    for _ in range(handlers):
+        interceptor.register_handler(
+            null_async_handler if async_mode else null_handler,
+            receive_parameters=parameters.get('greed_mode', False)
+        )
+    return interceptor
+
+
+def happy_path_cases() -> dict[str, tuple[Callable, Callable, bool]]:
+    """ Returns cases in format ``name: (call, baseline call, asynchronous)`` """
+    cases = {}
+    for asynchronous in (False, True):
+        function = async_target if asynchronous else target
+        mode = 'async' if asynchronous else 'sync'
+
+        global_interceptor = setup_interceptor(GlobalInterceptor, async_mode=asynchronous)
+        unit_interceptor = setup_interceptor(UnitInterceptor, async_mode=asynchronous)
+        looped_interceptor = setup_interceptor(LoopedInterceptor, async_mode=asynchronous)
+        nested_interceptor = NestedInterceptor({'global': global_interceptor, ValueError: unit_interceptor})
+
+        cases[f'happy/{mode}/global/intercept'] = global_interceptor.intercept(function)
+        cases[f'happy/{mode}/global/wrap'] = lambda number, i=global_interceptor, f=function: i.wrap(f, number)
+        cases[f'happy/{mode}/unit/intercept'] = unit_interceptor.intercept(ValueError)(function)
+        cases[f'happy/{mode}/unit/wrap'] = lambda number, i=unit_interceptor, f=function: i.wrap(f, ValueError, number)
+        cases[f'happy/{mode}/looped/intercept'] = looped_interceptor.intercept(function)
+        cases[f'happy/{mode}/looped/wrap'] = lambda number, i=looped_interceptor, f=function: i.wrap(f, number)
+        cases[f'happy/{mode}/nested/intercept'] = nested_interceptor.intercept('global')(function)
+        cases[f'happy/{mode}/nested/wrap'] = lambda number, i=nested_interceptor, f=function: i.wrap(f, 'global', number)
+
+        outer_interceptor = setup_interceptor(GlobalInterceptor, exceptions=[KeyError], async_mode=asynchronous)
+        cases[f'happy/{mode}/stacked/layers=3'] = outer_interceptor.intercept(
+            global_interceptor.intercept(unit_interceptor.intercept(ValueError)(function))
+        )
+
+    return {
+        name: (call, async_target if '/async/' in name else target, '/async/' in name)
+        for name, call in cases.items()
+    }
+
+
+def exception_path_cases() -> dict[str, tuple[Callable, Callable, bool]]:
+    """ Returns cases in format ``name: (call, baseline call, asynchronous)`` """
+    cases = {}
+    for asynchronous in (False, True):
+        function = async_failing_target if asynchronous else failing_target
+        mode = 'async' if asynchronous else 'sync'
+
+        for count in (0, 1, MANY):
+            loggers = setup_interceptor(GlobalInterceptor, loggers=count, async_mode=asynchronous)
+            handlers = setup_interceptor(GlobalInterceptor, handlers=count, async_mode=asynchronous)
+            cases[f'exception/{mode}/global/loggers={count}'] = loggers.intercept(function)
+            cases[f'exception/{mode}/global/handlers={count}'] = handlers.intercept(function)
+
+        greedy = setup_interceptor(GlobalInterceptor, loggers=1, handlers=MANY, greed_mode=True, async_mode=asynchronous)
+        cases[f'exception/{mode}/global/greed_mode/handlers={MANY}'] = greedy.intercept(function)
+
+        unit = setup_interceptor(UnitInterceptor, loggers=1, handlers=1, async_mode=asynchronous)
+        cases[f'exception/{mode}/unit/loggers=1/handlers=1'] = unit.intercept(ValueError)(function)
+
+        looped = setup_interceptor(LoopedInterceptor, loggers=1, handlers=1, async_mode=asynchronous, max_attempts=1)
+        cases[f'exception/{mode}/looped/max_attempts=1'] = _suppress(looped.intercept(function), asynchronous)
+
+        if asynchronous:
+            for fast in (True, False):
+                interceptor = setup_interceptor(
+                    GlobalInterceptor,
+                    loggers=MANY,
+                    handlers=MANY,
+                    async_mode=True,
+                    fast_handlers_execution=fast,
+                    fast_loggers_execution=fast
+                )
+                cases[f'exception/async/global/fast_execution={fast}/loggers={MANY}/handlers={MANY}'] = (
+                    interceptor.intercept(function)
+                )
+
+    return {
+        name: (
+            call,
+            _suppress(async_failing_target if '/async/' in name else failing_target, '/async/' in name),
+            '/async/' in name
+        )
+        for name, call in cases.items()
+    }
+
+
+def _suppress(function: Callable, asynchronous: bool) -> Callable:
+    """ Unwrapped baseline of the exception path: the same exception caught by ``try`` statement """
+    if asynchronous:
+        async def suppressed(number: int):
+            try:
+                return await function(number)
+            except ValueError:
+                return None
+    else:
+        def suppressed(number: int):
+            try:
+                return function(number)
+            except ValueError:
+                return None
+    return suppressed
+
+
+def measure(call: Callable, baseline: Callable, asynchronous: bool, number: int, repeat: int) -> dict:
+    runner = run_async if asynchronous else run_sync
+    try:
+        runner(call, min(number, 1000))
+    except Exception as exception:
+        # Broken case is reported instead of stopping the whole suite
+        return {'error': f'{exception.__class__.__name__}: {exception}'}
+
+    timings = [runner(call, number) for _ in range(repeat)]
+    baseline_timings = [runner(baseline, number) for _ in range(repeat)]
+
+    best = min(timings)
+    baseline_best = min(baseline_timings)
+    return {
+        'best_ns': round(best, 1),
+        'median_ns': round(statistics.median(timings), 1),
+        'baseline_best_ns': round(baseline_best, 1),
+        'overhead_ns': round(best - baseline_best, 1),
+        'ratio': round(best / baseline_best, 2),
+    }
+
+
+def compare(results: dict, previous_path: str) -> dict:
+    """ Relative change of the best timings against the previous report. Positive values mean slowdown """
+    previous = json.loads(Path(previous_path).read_text())['results']
+    return {
+        name: round(result['best_ns'] / previous[name]['best_ns'] - 1, 3)
+        for name, result in results.items()
+        if 'best_ns' in result and 'best_ns' in previous.get(name, {})
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=20000, help='Count of calls in one measurement')
+    parser.add_argument('--repeat', type=int, default=5, help='Count of measurements of every case')
+    parser.add_argument('--filter', default='', help='Runs only cases, which names contain the substring')
+    parser.add_argument('--production-mode', action='store_true', help='Disables runtime checks of wrap methods')
+    parser.add_argument('--output', default=None, help='Saves JSON report to the file')
+    parser.add_argument('--compare', default=None, help='Previous JSON report to compare with')
+    arguments = parser.parse_args()
+
+    if arguments.production_mode:
+        arguments_checker.set_production_mode()
+
+    cases = {**happy_path_cases(), **exception_path_cases()}
+    results = {
+        name: measure(call, baseline, asynchronous, arguments.number, arguments.repeat)
+        for name, (call, baseline, asynchronous) in cases.items()
+        if arguments.filter in name
+    }
+
+    report = {
+        'benchmark': 'interceptors_overhead',
+        'python': sys.version.split()[0],
+        'number': arguments.number,
+        'repeat': arguments.repeat,
+        'production_mode': arguments.production_mode,
+        'results': results,
+    }
+    if arguments.compare:
+        report['changes'] = compare(results, arguments.compare)
+
+    output = json.dumps(report, indent=2)
+    if arguments.output:
+        Path(arguments.output).write_text(output)
+    print(output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,43 @@
-from intercept_it.interceptors import (
-    GlobalInterceptor,
-    NestedInterceptor,
-    UnitInterceptor,
-    LoopedInterceptor
-)
-
-from intercept_it.loggers import STDLogger
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from intercept_it.interceptors import (
+        GlobalInterceptor,
+        NestedInterceptor,
+        UnitInterceptor,
+        LoopedInterceptor,
+        CircuitBreakerInterceptor
+    )
+
+    from intercept_it.loggers import STDLogger
+    from intercept_it.utils.instrumentation import intercept_class, intercept_module
+
+# Attributes are imported on the first access, so third-party dependencies of the loggers
+# are not imported by the services, which don't use them
+_LAZY_ATTRIBUTES = {
+    'GlobalInterceptor': 'intercept_it.interceptors.global_interceptor',
+    'NestedInterceptor': 'intercept_it.interceptors.nested_interceptor',
+    'UnitInterceptor': 'intercept_it.interceptors.unit_interceptor',
+    'LoopedInterceptor': 'intercept_it.interceptors.looped_interceptor',
+    'CircuitBreakerInterceptor': 'intercept_it.interceptors.circuit_breaker_interceptor',
+    'STDLogger': 'intercept_it.loggers.std_logger',
+    'intercept_class': 'intercept_it.utils.instrumentation',
+    'intercept_module': 'intercept_it.utils.instrumentation',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    attribute = getattr(import_module(module), name)
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -2,3 +2,4 @@ from intercept_it.interceptors.nested_interceptor import NestedInterceptor
 from intercept_it.interceptors.global_interceptor import GlobalInterceptor
 from intercept_it.interceptors.unit_interceptor import UnitInterceptor
 from intercept_it.interceptors.looped_interceptor import LoopedInterceptor
+from intercept_it.interceptors.circuit_breaker_interceptor import CircuitBreakerInterceptor
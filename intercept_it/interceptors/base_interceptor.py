@@ -1,10 +1,43 @@
+import sys
+import time
 import asyncio
-from typing import Callable, Coroutine
+import inspect
+from types import MethodType
+from weakref import WeakKeyDictionary
+from bisect import bisect_right
+from functools import partial
+from contextlib import aclosing
+from typing import Any, Callable, Coroutine
+from concurrent.futures import Executor
 
-from intercept_it.utils.models import DefaultHandler
+from intercept_it.utils.models import (
+    DefaultHandler,
+    DefaultLogger,
+    InterceptedEvent,
+    InterceptionLayer,
+    StackedLayers,
+)
 from intercept_it.loggers.base_logger import BaseLogger, BaseAsyncLogger
 from intercept_it.utils.checker import arguments_checker
-from intercept_it.utils.exceptions import InterceptItRunTimeException
+from intercept_it.utils.exceptions import InterceptItSetupException, InterceptItRunTimeException
+from intercept_it.utils.rate_limiting import EventsLimiter
+from intercept_it.utils.metrics import InterceptorMetrics, function_label
+from intercept_it.utils.background_tasks import BackgroundTasks
+from intercept_it.utils.enums import FunctionKindsEnum
+from intercept_it.utils.exceptions_index import ExceptionsIndex, RoutesIndex
+from intercept_it.utils.scheduling import (
+    shared_executor,
+    execute_in_parallel,
+    run_in_thread,
+    run_coroutine_blocking,
+)
+
+_FUNCTION = FunctionKindsEnum.FUNCTION
+_COROUTINE_FUNCTION = FunctionKindsEnum.COROUTINE_FUNCTION
+_ASYNC_GENERATOR_FUNCTION = FunctionKindsEnum.ASYNC_GENERATOR_FUNCTION
+
+# Attribute of the wrappers, which can be merged with the next interceptor
+_STACKED_LAYERS_ATTRIBUTE = '__intercept_it_layers__'
 
 
 class BaseInterceptor:
@@ -12,15 +45,26 @@ class BaseInterceptor:
     Implements loggers and handlers logic for any interceptor.
     Checks interceptor's setup parameters before the initialization
     """
+    # Interceptors, which execute the function a few times or track its completion, can't wrap async generators
+    _wraps_async_generators = True
+
     def __init__(
             self,
             exceptions: list[type[BaseException]] | None = None,
             loggers: list[BaseLogger | BaseAsyncLogger] | None = None,
             raise_exception: bool = False,
             greed_mode: bool = False,
-            async_mode: bool = False,
+            async_mode: bool | None = None,
             fast_handlers_execution: bool = True,
-            fast_loggers_execution: bool = True
+            fast_loggers_execution: bool = True,
+            subclass_matching: bool = False,
+            events_limiter: EventsLimiter | None = None,
+            metrics: InterceptorMetrics | None = None,
+            parallel_sync_execution: bool = False,
+            wait_parallel_execution: bool = True,
+            sync_executor: Executor | None = None,
+            background_tasks: BackgroundTasks | None = None,
+            loggers_timeout: int | float | None = None
     ):
         """
         :param exceptions: Collection of target exceptions
@@ -33,15 +77,42 @@ class BaseInterceptor:
         :param greed_mode: If equals ``True`` interceptor sends wrapped function parameters
             to some handlers. If not specified, feature disabled
 
-         :param async_mode: If equals ``True`` interceptor can work with coroutines.
-            If not specified, can wrap only ordinary functions.
-            Interceptor can't wrap ordinary function and coroutine at the same time!
+        :param async_mode: If equals ``True`` interceptor wraps coroutine functions,
+            if equals ``False`` - ordinary functions. If not specified, kind of every function is detected,
+            when it's wrapped. So one interceptor can wrap ordinary functions, coroutine functions and async generators
 
         :param fast_handlers_execution: If equals ``True`` handlers will be executed as tasks.
          If equals ``False`` they will be executed in order with ``await`` instruction.
 
         :param fast_loggers_execution: If equals ``True`` loggers will be executed as tasks.
          If equals ``False`` they will be executed in order with ``await`` instruction.
+
+        :param subclass_matching: If equals ``True`` interceptor also catches subclasses of the target exceptions.
+            If not specified, only the exact target exceptions are caught
+
+        :param events_limiter: Rate limit and sampling of the intercepted exceptions processing by loggers and handlers.
+            Next processed exception and the periodic reports of the limiter send count of suppressed ones to loggers.
+            If not specified, all exceptions are processed
+
+        :param metrics: Collector of the interceptor's counters and durations.
+            If not specified, metrics aren't collected
+
+        :param parallel_sync_execution: If equals ``True`` ordinary handlers and loggers are executed in parallel
+            by the executor according to ``fast_handlers_execution`` and ``fast_loggers_execution`` parameters.
+            Exception of one handler doesn't stop others. If not specified, they are executed in order
+
+        :param wait_parallel_execution: If equals ``True`` interceptor waits until parallel handlers and loggers
+            are finished and raises the first exception of them. If equals ``False`` their exceptions are printed
+
+        :param sync_executor: Executor of the parallel handlers and loggers and of the ordinary ones in the async mode.
+            If not specified, the shared one is used in the sync mode and the event loop default one in the async mode
+
+        :param background_tasks: Pool of the background tasks. If specified, loggers and handlers of the coroutines
+            are executed in the background and the wrapper doesn't wait for them
+
+        :param loggers_timeout: Maximum time in seconds of the one logger execution. Async loggers
+            are cancelled, when time is exceeded. Offloaded loggers aren't stopped, only their awaiting
+            is abandoned. If not specified, loggers aren't limited
         """
         arguments_checker.check_setup_parameters(
             loggers,
@@ -50,24 +121,69 @@ class BaseInterceptor:
             greed_mode,
             async_mode,
             fast_handlers_execution,
-            fast_loggers_execution
+            fast_loggers_execution,
+            subclass_matching
         )
+        arguments_checker.check_events_limiter(events_limiter)
+        arguments_checker.check_metrics(metrics)
+        arguments_checker.check_boolean_arguments(
+            {
+                'parallel_sync_execution': parallel_sync_execution,
+                'wait_parallel_execution': wait_parallel_execution,
+            }
+        )
+        arguments_checker.check_executor(sync_executor)
+        arguments_checker.check_background_tasks(background_tasks)
+        arguments_checker.check_execution_timeout(loggers_timeout)
 
-        self._handlers: list[DefaultHandler] | list[None] = []
-        self._loggers = loggers
+        self.async_mode = async_mode
+        self._handlers: tuple[DefaultHandler, ...] = ()
+        self._loggers: tuple[DefaultLogger, ...] = tuple(DefaultLogger(logger) for logger in loggers or ())
         self._greed_mode = greed_mode
         self._fast_handlers_execution = fast_handlers_execution
         self._fast_loggers_execution = fast_loggers_execution
+        self._subclass_matching = subclass_matching
+        self._events_limiter = events_limiter
+        self._metrics = metrics
+        self._parallel_sync_execution = parallel_sync_execution
+        self._wait_parallel_execution = wait_parallel_execution
+        self._sync_executor = sync_executor
+        self._background_tasks = background_tasks
+        self._loggers_timeout = loggers_timeout
+
+        # Kinds of the wrapped functions, so wrap methods don't inspect the function on every call
+        self._function_kinds: WeakKeyDictionary[Callable, FunctionKindsEnum] = WeakKeyDictionary()
+        # Metrics labels of the wrapped functions, so counters don't build them on every call
+        self._function_labels: WeakKeyDictionary[Callable, str] = WeakKeyDictionary()
+
+        self.handlers_timeouts = 0
+        self.loggers_timeouts = 0
+
+        if events_limiter is not None:
+            events_limiter.add_reporter(self._report_suppressed)
+        self._compile_chains()
 
     def __call__(self, *args, **kwargs):
         raise InterceptItRunTimeException('Invalid interceptor using. Use interceptor methods to call it')
 
+    async def aclose(self, timeout: int | float | None = None) -> None:
+        """
+        Waits for loggers and handlers executed in the background. Should be called at the application shutdown
+
+        :param timeout: Time in seconds, after which unfinished tasks are cancelled. If not specified, waits forever
+        """
+        if self._background_tasks is not None:
+            await self._background_tasks.aclose(timeout)
+
     def register_handler(
             self,
             attached_callable: Callable,
             *args,
             execution_order: int = 1,
             receive_parameters: bool = False,
+            limiter: EventsLimiter | None = None,
+            timeout: int | float | None = None,
+            exceptions: list[type[BaseException]] | None = None,
             **kwargs
     ) -> None:
         """
@@ -77,75 +193,828 @@ class BaseInterceptor:
         :param args: Positional arguments of function
         :param execution_order: Handlers execution order
         :param receive_parameters: Allows to receive parameters from the wrapped function
+        :param limiter: Rate limit and sampling of the handler executions. Its periodic reports are sent to loggers
+        :param timeout: Maximum time in seconds of the handler execution. Coroutine handlers are cancelled,
+            when time is exceeded. Handlers offloaded in the async mode aren't stopped, only their awaiting
+            is abandoned: the executor thread keeps running the handler
+        :param exceptions: Exceptions processed by the handler, including their subclasses.
+            If not specified, handler processes all intercepted exceptions
         :param kwargs: Keyword arguments of function
         """
-        self._handlers.append(
-            DefaultHandler(
-                callable=attached_callable,
-                args=args,
-                execution_order=execution_order,
-                receive_parameters=receive_parameters,
-                kwargs=kwargs
-            )
+        arguments_checker.check_events_limiter(limiter)
+        arguments_checker.check_execution_timeout(timeout)
+        arguments_checker.check_exceptions_filter(exceptions)
+        handler = DefaultHandler(
+            callable=attached_callable,
+            args=args,
+            kwargs=kwargs,
+            execution_order=execution_order,
+            receive_parameters=receive_parameters,
+            limiter=limiter,
+            is_coroutine_function=_is_coroutine_function(attached_callable),
+            timeout=timeout,
+            exceptions=tuple(exceptions) if exceptions is not None else None
         )
-        # Sorts handlers by execution_order parameter
-        self._handlers = sorted(self._handlers, key=lambda priority: priority)
-
-    def _execute_sync_handlers(self, exception: BaseException, *intercepted_args, **intercepted_kwargs) -> None:
-        self._process_sync_loggers(str(exception))
-        self._process_sync_handlers(intercepted_args, intercepted_kwargs)
-
-    async def _execute_async_handlers(self, exception: BaseException, *intercepted_args, **intercepted_kwargs) -> None:
-        await self._process_async_loggers(str(exception))
-        await self._process_async_handlers(intercepted_args, intercepted_kwargs)
-
-    def _process_sync_loggers(self, message: str) -> None:
-        if self._loggers:
-            [logger.save_logs(message) for logger in self._loggers]
-
-    async def _process_async_loggers(self, message: str) -> None:
-        if self._loggers:
-            if self._fast_loggers_execution:
-                await asyncio.gather(*[logger.save_logs(message) for logger in self._loggers])
-            else:
-                [await logger.save_logs(message) for logger in self._loggers]
-
-    def _process_sync_handlers(self, args, kwargs) -> None:
-        if self._handlers:
-            if self._greed_mode:
-                [
-                    handler.callable(*handler.args, *args, **handler.kwargs, **kwargs)
-                    if handler.receive_parameters
-                    else handler.callable(*handler.args, **handler.kwargs)
-                    for handler in self._handlers
-                 ]
-            else:
-                [
-                    handler.callable(*handler.args, **handler.kwargs)
-                    for handler in self._handlers
-                ]
+        # Keeps handlers sorted by execution_order parameter. Handlers with the same order keep registration order
+        index = bisect_right(self._handlers, execution_order, key=lambda registered: registered.execution_order)
+        self._handlers = (*self._handlers[:index], handler, *self._handlers[index:])
+        if limiter is not None:
+            limiter.add_reporter(self._report_suppressed)
+        self._compile_chains()
+
+    def register_logger(
+            self,
+            logger: BaseLogger | BaseAsyncLogger,
+            exceptions: list[type[BaseException]] | None = None
+    ) -> None:
+        """
+        Adds logger to the interceptor after the initialization
+
+        :param logger: Logger object
+        :param exceptions: Exceptions processed by the logger, including their subclasses.
+            If not specified, logger processes all intercepted exceptions
+        """
+        arguments_checker.check_loggers([logger])
+        arguments_checker.check_exceptions_filter(exceptions)
+        self._loggers = (
+            *self._loggers,
+            DefaultLogger(logger, tuple(exceptions) if exceptions is not None else None)
+        )
+        self._compile_chains()
+
+    def _compile_chains(self) -> None:
+        """
+        Freezes current loggers and handlers into the flat chains, which are called by the wrappers.
+        Chains are specialized for the interceptor's configuration, so wrappers don't check it at runtime
+        """
+        if any(registered.exceptions is not None for registered in (*self._loggers, *self._handlers)):
+            self._sync_chain, self._async_chain = self._compile_routed_chains()
+        else:
+            self._sync_chain = self._compile_sync_chain(self._loggers, self._handlers)
+            self._async_chain = self._compile_async_chain(self._loggers, self._handlers)
+
+        if self._metrics is not None:
+            self._sync_chain, self._async_chain = self._count_intercepted(self._sync_chain, self._async_chain)
+
+    def _compile_routed_chains(self) -> tuple[Callable, Callable]:
+        """
+        Dispatches every exception to the chains of its route. Route contains only loggers and handlers,
+        which filters match the exception class or its parents. Routes are compiled for the first exception
+        of every class, so the filters are checked once. Classes with the same loggers and handlers share the chains
+        """
+        loggers = self._loggers
+        handlers = self._handlers
+        compiled: dict[tuple[tuple[int, ...], tuple[int, ...]], tuple[Callable, Callable]] = {}
+
+        def compile_route(exception_class: type[BaseException]) -> tuple[Callable, Callable]:
+            key = (
+                tuple(index for index, logger in enumerate(loggers) if _subscribed(logger, exception_class)),
+                tuple(index for index, handler in enumerate(handlers) if _subscribed(handler, exception_class))
+            )
+            if key not in compiled:
+                route_loggers = tuple(loggers[index] for index in key[0])
+                route_handlers = tuple(handlers[index] for index in key[1])
+                compiled[key] = (
+                    self._compile_sync_chain(route_loggers, route_handlers),
+                    self._compile_async_chain(route_loggers, route_handlers)
+                )
+            return compiled[key]
+
+        routes = RoutesIndex(compile_route)
+
+        def routed_sync_chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+            routes[exception.__class__][0](function, exception, args, kwargs)
+
+        async def routed_async_chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+            await routes[exception.__class__][1](function, exception, args, kwargs)
+        return routed_sync_chain, routed_async_chain
+
+    def _count_intercepted(self, sync_chain: Callable, async_chain: Callable) -> tuple[Callable, Callable]:
+        """ Counts every intercepted exception, including ones suppressed by the events limiter """
+        metrics = self._metrics
+        label = self._function_label
+
+        def counted_sync_chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+            metrics.record_intercepted(label(function), exception)
+            sync_chain(function, exception, args, kwargs)
+
+        async def counted_async_chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+            metrics.record_intercepted(label(function), exception)
+            await async_chain(function, exception, args, kwargs)
+        return counted_sync_chain, counted_async_chain
+
+    def _function_kind(self, function: Callable) -> FunctionKindsEnum:
+        """
+        Chooses the wrapper for the function. Async generators are always detected.
+        Coroutine functions are detected, if ``async_mode`` isn't specified.
+        Kind is cached for every function. Bound methods share the kind of their function
+
+        :param function: Wrapped function
+        """
+        key = function.__func__ if isinstance(function, MethodType) else function
+        try:
+            return self._function_kinds[key]
+        except (KeyError, TypeError):
+            pass
+
+        kind = self._detect_function_kind(function)
+        try:
+            self._function_kinds[key] = kind
+        except TypeError:
+            # Objects without weak references support are inspected every time
+            pass
+        return kind
+
+    def _function_label(self, function: Callable) -> str:
+        """
+        Returns metrics label of the function. Label is cached for every function.
+        Bound methods share the label of their function
+
+        :param function: Wrapped function
+        """
+        key = function.__func__ if isinstance(function, MethodType) else function
+        try:
+            return self._function_labels[key]
+        except (KeyError, TypeError):
+            pass
+
+        label = function_label(key)
+        try:
+            self._function_labels[key] = label
+        except TypeError:
+            pass
+        return label
+
+    def _wrapped_kind(self, function: Callable) -> FunctionKindsEnum:
+        """
+        Chooses the wrapper for the ``wrap`` methods. If ``async_mode`` is specified, function isn't inspected,
+        so async generators are detected only by the ``intercept`` methods
+
+        :param function: Wrapped function
+        """
+        async_mode = self.async_mode
+        if async_mode is None:
+            return self._function_kind(function)
+        return _COROUTINE_FUNCTION if async_mode else _FUNCTION
+
+    def _detect_function_kind(self, function: Callable) -> FunctionKindsEnum:
+        if inspect.isasyncgenfunction(function):
+            if not self._wraps_async_generators:
+                raise InterceptItSetupException(f'{self.__class__.__name__} can\'t wrap async generators')
+            return _ASYNC_GENERATOR_FUNCTION
+        if self.async_mode is None:
+            return _COROUTINE_FUNCTION if _is_coroutine_function(function) else _FUNCTION
+        return _COROUTINE_FUNCTION if self.async_mode else _FUNCTION
+
+    def _compile_async_generator_wrapper(
+            self,
+            function: Callable,
+            matches: ExceptionsIndex,
+            raise_exception: bool
+    ) -> Callable:
+        """
+        Generates the async generator wrapper. Exceptions are intercepted during the iteration.
+        If exception isn't sent higher up the call stack, iteration is finished
+
+        :param function: Wrapped async generator function
+        :param matches: Index of the target exceptions
+        :param raise_exception: If equals ``True`` intercepted exceptions are sent higher up the call stack
+        """
+        interceptor = self
+        targets = matches.targets
+
+        async def wrapper(*args, **kwargs):
+            async with aclosing(function(*args, **kwargs)) as generator:
+                try:
+                    async for item in generator:
+                        yield item
+                except targets as exception:
+                    if matches[exception.__class__] is None:
+                        raise
+                    await interceptor._async_chain(function, exception, args, kwargs)
+                    if raise_exception:
+                        raise
+        return wrapper
+
+    def _complete_wrapper(
+            self,
+            wrapper: Callable,
+            function: Callable,
+            kind: FunctionKindsEnum,
+            layer: InterceptionLayer
+    ) -> Callable:
+        """
+        Instruments the compiled wrapper or, if metrics aren't collected, marks it as the interception layer.
+        So the next interceptor stacked over the wrapper can merge with it
+
+        :param wrapper: Compiled wrapper
+        :param function: Wrapped function
+        :param kind: Kind of the wrapped function
+        :param layer: Interceptor's layer
+        """
+        if self._metrics is not None:
+            return self._instrument(wrapper, function)
+
+        if kind is not _ASYNC_GENERATOR_FUNCTION:
+            setattr(wrapper, _STACKED_LAYERS_ATTRIBUTE, StackedLayers(wrapper, function, kind, (layer,)))
+        return wrapper
+
+    def _flatten(self, function: Callable, kind: FunctionKindsEnum, layer: InterceptionLayer) -> Callable | None:
+        """
+        Merges the interceptor with the ones, which already wrap the function. Merged wrapper calls the original
+        function in the single frame and passes the exception through the layers from the innermost one,
+        as the stacked wrappers do. Returns ``None`` if the layers can't be merged
+
+        :param function: Function wrapped by the interceptors or any other function
+        :param kind: Kind of the function detected by the interceptor
+        :param layer: Interceptor's layer
+        """
+        stacked = getattr(function, _STACKED_LAYERS_ATTRIBUTE, None)
+        if not isinstance(stacked, StackedLayers) or stacked.kind is not kind or self._metrics is not None:
+            return None
+        # Decorators like functools.wraps copy the attribute to their own wrappers. They are stacked as usual
+        if stacked.wrapper is not function:
+            return None
+
+        layers = (*stacked.layers, layer)
+        if kind is _COROUTINE_FUNCTION:
+            wrapper = self._compile_layered_async_wrapper(stacked.function, layers)
+        else:
+            wrapper = self._compile_layered_sync_wrapper(stacked.function, layers)
+
+        setattr(wrapper, _STACKED_LAYERS_ATTRIBUTE, StackedLayers(wrapper, stacked.function, kind, layers))
+        return wrapper
+
+    @staticmethod
+    def _compile_layered_sync_wrapper(function: Callable, layers: tuple[InterceptionLayer, ...]) -> Callable:
+        """
+        Generates the wrapper of the merged interceptors. Exception is processed by every layer, which matches it,
+        until some layer doesn't send it higher. Exception of the layer's handler replaces the processed one
+
+        :param function: Original function
+        :param layers: Interceptors' layers from the innermost to the outermost
+        """
+        targets = tuple(dict.fromkeys(target for layer in layers for target in layer.matches.targets))
+
+        def wrapper(*args, **kwargs):
+            try:
+                return function(*args, **kwargs)
+            except targets as exception:
+                error = exception
+                for interceptor, matches, raise_exception in layers:
+                    if matches[error.__class__] is None:
+                        continue
+                    try:
+                        interceptor._sync_chain(function, error, args, kwargs)
+                    except BaseException as handler_error:
+                        error = handler_error
+                        continue
+                    if not raise_exception:
+                        return None
+
+                if error is exception:
+                    raise
+                raise error
+        return wrapper
+
+    @staticmethod
+    def _compile_layered_async_wrapper(function: Callable, layers: tuple[InterceptionLayer, ...]) -> Callable:
+        """
+        Generates the coroutine wrapper of the merged interceptors. Works as the ordinary one
+
+        :param function: Original coroutine function
+        :param layers: Interceptors' layers from the innermost to the outermost
+        """
+        targets = tuple(dict.fromkeys(target for layer in layers for target in layer.matches.targets))
+
+        async def wrapper(*args, **kwargs):
+            try:
+                return await function(*args, **kwargs)
+            except targets as exception:
+                error = exception
+                for interceptor, matches, raise_exception in layers:
+                    if matches[error.__class__] is None:
+                        continue
+                    try:
+                        await interceptor._async_chain(function, error, args, kwargs)
+                    except BaseException as handler_error:
+                        error = handler_error
+                        continue
+                    if not raise_exception:
+                        return None
+
+                if error is exception:
+                    raise
+                raise error
+        return wrapper
+
+    def _instrument(self, wrapper: Callable, function: Callable) -> Callable:
+        """
+        Counts calls of the compiled wrapper and exceptions sent higher up the call stack.
+        Wrapper is returned as is, if metrics aren't collected
+
+        :param wrapper: Compiled wrapper
+        :param function: Wrapped function
+        """
+        metrics = self._metrics
+        if metrics is None:
+            return wrapper
+        label = self._function_label(function)
+
+        if inspect.isasyncgenfunction(wrapper):
+            async def instrumented_wrapper(*args, **kwargs):
+                metrics.record_call(label)
+                try:
+                    async for item in wrapper(*args, **kwargs):
+                        yield item
+                except GeneratorExit:
+                    raise
+                except BaseException:
+                    metrics.record_raised(label)
+                    raise
+        elif inspect.iscoroutinefunction(wrapper):
+            async def instrumented_wrapper(*args, **kwargs):
+                metrics.record_call(label)
+                try:
+                    return await wrapper(*args, **kwargs)
+                except BaseException:
+                    metrics.record_raised(label)
+                    raise
+        else:
+            def instrumented_wrapper(*args, **kwargs):
+                metrics.record_call(label)
+                try:
+                    return wrapper(*args, **kwargs)
+                except BaseException:
+                    metrics.record_raised(label)
+                    raise
+        return instrumented_wrapper
+
+    def _instrumented_sync_call(self, function: Callable, wrapper: Callable, *arguments) -> Any:
+        """
+        Counts the call of the ``wrap`` method and exception sent higher up the call stack.
+        Works as the instrumented wrapper without its compilation on every call
+
+        :param function: Wrapped function
+        :param wrapper: Control logic method of the interceptor
+        :param arguments: Arguments of the control logic method
+        """
+        metrics = self._metrics
+        label = self._function_label(function)
+        metrics.record_call(label)
+        try:
+            return wrapper(*arguments)
+        except BaseException:
+            metrics.record_raised(label)
+            raise
+
+    async def _instrumented_async_call(self, function: Callable, wrapper: Callable, *arguments) -> Any:
+        """
+        Counts the call of the ``wrap`` method with the coroutine function. Works as the ordinary one
+
+        :param function: Wrapped coroutine function
+        :param wrapper: Control logic coroutine method of the interceptor
+        :param arguments: Arguments of the control logic method
+        """
+        metrics = self._metrics
+        label = self._function_label(function)
+        metrics.record_call(label)
+        try:
+            return await wrapper(*arguments)
+        except BaseException:
+            metrics.record_raised(label)
+            raise
+
+    def _measure_sync_stage(self, stage: str, process: Callable | None) -> Callable | None:
+        """ Observes execution time of the loggers or handlers, if metrics are collected """
+        metrics = self._metrics
+        if metrics is None or process is None:
+            return process
 
-    async def _process_async_handlers(self, args, kwargs) -> None:
-        if self._handlers:
-            handlers = await self._generate_handlers(args, kwargs)
-            await self._execute_handlers(handlers)
+        def measured_process(*args) -> None:
+            started = time.perf_counter()
+            try:
+                process(*args)
+            finally:
+                metrics.observe_duration(stage, time.perf_counter() - started)
+        return measured_process
+
+    def _measure_async_stage(self, stage: str, process: Callable | None) -> Callable | None:
+        """ Observes execution time of the loggers or handlers coroutines, if metrics are collected """
+        metrics = self._metrics
+        if metrics is None or process is None:
+            return process
+
+        async def measured_process(*args) -> None:
+            started = time.perf_counter()
+            try:
+                await process(*args)
+            finally:
+                metrics.observe_duration(stage, time.perf_counter() - started)
+        return measured_process
+
+    def _compile_sync_chain(
+            self,
+            loggers: tuple[DefaultLogger, ...],
+            handlers: tuple[DefaultHandler, ...]
+    ) -> Callable[[Callable, BaseException, tuple, dict], None]:
+        process_loggers = self._measure_sync_stage('loggers', self._compile_sync_loggers(loggers))
+        process_handlers = self._measure_sync_stage('handlers', self._compile_sync_handlers(handlers))
+        create_event = self._compile_event_factory()
+
+        if process_loggers and process_handlers:
+            def chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+                process_loggers(create_event(exception, function, args, kwargs))
+                process_handlers(args, kwargs)
+        elif process_loggers:
+            def chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+                process_loggers(create_event(exception, function, args, kwargs))
+        elif process_handlers:
+            def chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+                process_handlers(args, kwargs)
+        else:
+            def chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+                pass
+
+        if self._events_limiter is None or not (process_loggers or process_handlers):
+            return chain
+
+        limiter = self._events_limiter
+        unlimited_chain = chain
+
+        def chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+            if limiter.allow():
+                unlimited_chain(function, exception, args, kwargs)
+        return chain
+
+    def _compile_async_chain(
+            self,
+            loggers: tuple[DefaultLogger, ...],
+            handlers: tuple[DefaultHandler, ...]
+    ) -> Callable[[Callable, BaseException, tuple, dict], Coroutine]:
+        process_loggers = self._measure_async_stage('loggers', self._compile_async_loggers(loggers))
+        process_handlers = self._measure_async_stage('handlers', self._compile_async_handlers(handlers))
+        create_event = self._compile_event_factory()
+
+        if process_loggers and process_handlers:
+            async def chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+                await process_loggers(create_event(exception, function, args, kwargs))
+                await process_handlers(args, kwargs)
+        elif process_loggers:
+            async def chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+                await process_loggers(create_event(exception, function, args, kwargs))
+        elif process_handlers:
+            async def chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+                await process_handlers(args, kwargs)
+        else:
+            async def chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+                pass
+
+        if not (process_loggers or process_handlers):
+            return chain
+
+        if self._events_limiter is not None:
+            limiter = self._events_limiter
+            unlimited_chain = chain
+
+            async def chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+                if limiter.allow():
+                    await unlimited_chain(function, exception, args, kwargs)
+
+        if self._background_tasks is not None:
+            background_tasks = self._background_tasks
+            foreground_chain = chain
+
+            async def chain(function: Callable, exception: BaseException, args: tuple, kwargs: dict) -> None:
+                await background_tasks.submit(foreground_chain, function, exception, args, kwargs)
+        return chain
+
+    def _compile_event_factory(self) -> Callable[[BaseException, Callable, tuple, dict], InterceptedEvent]:
+        """ Generates factory of the events for loggers. Parameters are sent only in the greed mode """
+        greed_mode = self._greed_mode
+        limiter = self._events_limiter
+
+        if limiter is not None:
+            def create_event(exception: BaseException, function: Callable, args: tuple, kwargs: dict):
+                if greed_mode:
+                    return InterceptedEvent(exception, function, args, kwargs, limiter.pop_suppressed())
+                return InterceptedEvent(exception, function, suppressed=limiter.pop_suppressed())
+        elif greed_mode:
+            create_event = InterceptedEvent
+        else:
+            def create_event(exception: BaseException, function: Callable, args: tuple, kwargs: dict):
+                return InterceptedEvent(exception, function)
+        return create_event
+
+    def _compile_sync_loggers(
+            self,
+            registered_loggers: tuple[DefaultLogger, ...]
+    ) -> Callable[[InterceptedEvent], None] | None:
+        if not registered_loggers:
+            return None
+
+        loggers = self._freeze_loggers(registered_loggers, asynchronous=False)
+
+        if self._parallel_sync_execution and self._fast_loggers_execution:
+            execute = self._compile_parallel_execution(len(loggers))
+
+            def process_loggers(event: InterceptedEvent) -> None:
+                execute([
+                    partial(save_logs, event if structured else event.message)
+                    for save_logs, structured in loggers
+                ])
+        else:
+            def process_loggers(event: InterceptedEvent) -> None:
+                for save_logs, structured in loggers:
+                    save_logs(event if structured else event.message)
+        return process_loggers
+
+    def _compile_async_loggers(
+            self,
+            registered_loggers: tuple[DefaultLogger, ...]
+    ) -> Callable[[InterceptedEvent], Coroutine] | None:
+        if not registered_loggers:
+            return None
+
+        loggers = self._freeze_loggers(registered_loggers, asynchronous=True)
+
+        if len(loggers) == 1:
+            save_logs, structured = loggers[0]
+
+            async def process_loggers(event: InterceptedEvent) -> None:
+                await save_logs(event if structured else event.message)
+        elif self._fast_loggers_execution:
+            async def process_loggers(event: InterceptedEvent) -> None:
+                await asyncio.gather(
+                    *[save_logs(event if structured else event.message) for save_logs, structured in loggers]
+                )
+        else:
+            async def process_loggers(event: InterceptedEvent) -> None:
+                for save_logs, structured in loggers:
+                    await save_logs(event if structured else event.message)
+        return process_loggers
+
+    def _compile_sync_handlers(
+            self,
+            registered_handlers: tuple[DefaultHandler, ...]
+    ) -> Callable[[tuple, dict], None] | None:
+        if not registered_handlers:
+            return None
+
+        if self._parallel_sync_execution and self._fast_handlers_execution:
+            return self._compile_parallel_sync_handlers(registered_handlers)
+
+        if self._greed_mode:
+            greedy_handlers = self._freeze_greedy_handlers(registered_handlers, asynchronous=False)
+
+            def process_handlers(args: tuple, kwargs: dict) -> None:
+                for handler, handler_args, handler_kwargs, receive_parameters in greedy_handlers:
+                    if receive_parameters:
+                        handler(*handler_args, *args, **handler_kwargs, **kwargs)
+                    else:
+                        handler(*handler_args, **handler_kwargs)
+        else:
+            handlers = self._freeze_handlers(registered_handlers, asynchronous=False)
+
+            def process_handlers(args: tuple, kwargs: dict) -> None:
+                for handler, handler_args, handler_kwargs in handlers:
+                    handler(*handler_args, **handler_kwargs)
+        return process_handlers
+
+    def _compile_parallel_sync_handlers(
+            self,
+            registered_handlers: tuple[DefaultHandler, ...]
+    ) -> Callable[[tuple, dict], None]:
+        execute = self._compile_parallel_execution(len(registered_handlers))
 
-    async def _generate_handlers(self, args, kwargs) -> list[Coroutine]:
         if self._greed_mode:
-            return [
-                handler.callable(*handler.args, *args, **handler.kwargs, **kwargs)
-                if handler.receive_parameters
-                else handler.callable(*handler.args, **handler.kwargs)
-                for handler in self._handlers
-            ]
+            greedy_handlers = self._freeze_greedy_handlers(registered_handlers, asynchronous=False)
+
+            def process_handlers(args: tuple, kwargs: dict) -> None:
+                execute([
+                    partial(handler, *handler_args, *args, **handler_kwargs, **kwargs)
+                    if receive_parameters
+                    else partial(handler, *handler_args, **handler_kwargs)
+                    for handler, handler_args, handler_kwargs, receive_parameters in greedy_handlers
+                ])
         else:
-            return [
-                handler.callable(*handler.args, **handler.kwargs)
-                for handler in self._handlers
-            ]
-
-    async def _execute_handlers(self, handlers: list[Coroutine]) -> None:
-        if self._fast_handlers_execution:
-            await asyncio.gather(*handlers)
+            handlers = self._freeze_handlers(registered_handlers, asynchronous=False)
+
+            def process_handlers(args: tuple, kwargs: dict) -> None:
+                execute([
+                    partial(handler, *handler_args, **handler_kwargs)
+                    for handler, handler_args, handler_kwargs in handlers
+                ])
+        return process_handlers
+
+    def _compile_parallel_execution(self, calls_count: int) -> Callable[[list[Callable]], None]:
+        """
+        Generates the executor of the handlers or loggers calls. Single call isn't sent to the executor,
+        if interceptor waits for it anyway
+
+        :param calls_count: Count of the calls in the every execution
+        """
+        wait = self._wait_parallel_execution
+        sync_executor = self._sync_executor
+
+        if wait and calls_count == 1:
+            def execute(calls: list[Callable]) -> None:
+                calls[0]()
         else:
-            [await handler for handler in handlers]
+            def execute(calls: list[Callable]) -> None:
+                execute_in_parallel(sync_executor or shared_executor(), calls, wait)
+        return execute
+
+    def _compile_async_handlers(
+            self,
+            registered_handlers: tuple[DefaultHandler, ...]
+    ) -> Callable[[tuple, dict], Coroutine] | None:
+        if not registered_handlers:
+            return None
+
+        if self._greed_mode:
+            greedy_handlers = self._freeze_greedy_handlers(registered_handlers, asynchronous=True)
+
+            def generate_handlers(args: tuple, kwargs: dict) -> list[Coroutine]:
+                return [
+                    handler(*handler_args, *args, **handler_kwargs, **kwargs)
+                    if receive_parameters
+                    else handler(*handler_args, **handler_kwargs)
+                    for handler, handler_args, handler_kwargs, receive_parameters in greedy_handlers
+                ]
+        else:
+            handlers = self._freeze_handlers(registered_handlers, asynchronous=True)
+
+            def generate_handlers(args: tuple, kwargs: dict) -> list[Coroutine]:
+                return [handler(*handler_args, **handler_kwargs) for handler, handler_args, handler_kwargs in handlers]
+
+        if self._fast_handlers_execution and len(registered_handlers) > 1:
+            async def process_handlers(args: tuple, kwargs: dict) -> None:
+                await asyncio.gather(*generate_handlers(args, kwargs))
+        else:
+            async def process_handlers(args: tuple, kwargs: dict) -> None:
+                for handler in generate_handlers(args, kwargs):
+                    await handler
+        return process_handlers
+
+    def _freeze_loggers(
+            self,
+            registered_loggers: tuple[DefaultLogger, ...],
+            asynchronous: bool
+    ) -> tuple[tuple[Callable, bool], ...]:
+        """
+        In the async mode ordinary loggers are converted to coroutine functions.
+        Blocking ones are executed by the executor, so they don't block the event loop.
+        In the sync mode async loggers are converted to ordinary functions. Coroutines are limited by the timeout
+        """
+        loggers = []
+        for logger, _ in registered_loggers:
+            save_logs = logger.save_logs
+            is_coroutine_function = _is_coroutine_function(save_logs)
+
+            if asynchronous and not is_coroutine_function:
+                save_logs = self._offload(save_logs) if logger.blocking else _as_coroutine_function(save_logs)
+            if (asynchronous or is_coroutine_function) and self._loggers_timeout is not None:
+                save_logs = self._limit_time(save_logs, self._loggers_timeout, 'loggers')
+            if not asynchronous and is_coroutine_function:
+                save_logs = _as_blocking_function(save_logs)
+
+            loggers.append((save_logs, logger.structured))
+        return tuple(loggers)
+
+    def _freeze_handlers(
+            self,
+            registered_handlers: tuple[DefaultHandler, ...],
+            asynchronous: bool
+    ) -> tuple[tuple[Callable, tuple, dict], ...]:
+        return tuple(
+            (self._prepare_handler(handler, asynchronous), handler.args, handler.kwargs)
+            for handler in registered_handlers
+        )
+
+    def _freeze_greedy_handlers(
+            self,
+            registered_handlers: tuple[DefaultHandler, ...],
+            asynchronous: bool
+    ) -> tuple[tuple[Callable, tuple, dict, bool], ...]:
+        return tuple(
+            (self._prepare_handler(handler, asynchronous), handler.args, handler.kwargs, handler.receive_parameters)
+            for handler in registered_handlers
+        )
+
+    def _prepare_handler(self, handler: DefaultHandler, asynchronous: bool) -> Callable:
+        """
+        Wraps handler with its limiter. In the async mode ordinary handlers are executed by the executor,
+        so they don't block the event loop. In the sync mode coroutine handlers are executed
+        by the shared background event loop. Coroutines are limited by the timeout. Other handlers are returned as is
+        """
+        attached_callable = handler.callable
+        if asynchronous and not handler.is_coroutine_function:
+            attached_callable = self._offload(attached_callable)
+        if (asynchronous or handler.is_coroutine_function) and handler.timeout is not None:
+            attached_callable = self._limit_time(attached_callable, handler.timeout, 'handlers')
+        if not asynchronous and handler.is_coroutine_function:
+            attached_callable = _as_blocking_function(attached_callable)
+
+        if handler.limiter is None:
+            return attached_callable
+
+        limiter = handler.limiter
+        if asynchronous:
+            async def limited_handler(*args, **kwargs) -> None:
+                if limiter.allow():
+                    await attached_callable(*args, **kwargs)
+        else:
+            def limited_handler(*args, **kwargs) -> None:
+                if limiter.allow():
+                    attached_callable(*args, **kwargs)
+        return limited_handler
+
+    def _limit_time(
+            self,
+            coroutine_function: Callable[..., Coroutine],
+            timeout: int | float,
+            stage: str
+    ) -> Callable[..., Coroutine]:
+        """
+        Cancels the coroutine, when it exceeds the timeout. Timeouts are counted instead of raising.
+        Exceptions of the coroutine itself, including ``TimeoutError``, are raised as is
+
+        :param coroutine_function: Handler or logger
+        :param timeout: Maximum execution time in seconds
+        :param stage: ``loggers`` or ``handlers``
+        """
+        interceptor = self
+
+        async def time_limited_function(*args, **kwargs) -> None:
+            task = asyncio.ensure_future(coroutine_function(*args, **kwargs))
+            try:
+                done, _ = await asyncio.wait((task,), timeout=timeout)
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+
+            if not done:
+                task.cancel()
+                interceptor._record_timeout(stage)
+                return
+            task.result()
+        return time_limited_function
+
+    def _record_timeout(self, stage: str) -> None:
+        if stage == 'handlers':
+            self.handlers_timeouts += 1
+        else:
+            self.loggers_timeouts += 1
+
+        if self._metrics is not None:
+            self._metrics.record_timeout(stage)
+
+    def _report_suppressed(self, suppressed: int) -> None:
+        """
+        Sends the periodic report of the events limiter to all loggers as a string message.
+        Report of the interceptor without loggers is printed to stderr
+
+        :param suppressed: Count of the events suppressed since the previous report
+        """
+        message = f'{suppressed} events suppressed by the limiter'
+        loggers = self._freeze_loggers(self._loggers, asynchronous=False)
+        if not loggers:
+            print(message, file=sys.stderr)
+            return
+
+        for save_logs, _ in loggers:
+            save_logs(message)
+
+    def _offload(self, function: Callable) -> Callable[..., Coroutine]:
+        """
+        Converts ordinary function to the coroutine function, which executes it by the executor.
+        The running function can't be cancelled, so the timeout only abandons its awaiting
+        """
+        sync_executor = self._sync_executor
+
+        async def offloaded_function(*args, **kwargs):
+            return await run_in_thread(sync_executor, function, *args, **kwargs)
+        return offloaded_function
+
+
+def _is_coroutine_function(function: Callable) -> bool:
+    """ Detects coroutine functions, including partial objects and objects with the async ``__call__`` method """
+    return inspect.iscoroutinefunction(function) or inspect.iscoroutinefunction(getattr(function, '__call__', None))
+
+
+def _subscribed(registered: DefaultLogger | DefaultHandler, exception_class: type[BaseException]) -> bool:
+    """ Checks if the logger or handler processes the exception class """
+    return registered.exceptions is None or issubclass(exception_class, registered.exceptions)
+
+
+def _as_blocking_function(coroutine_function: Callable[..., Coroutine]) -> Callable:
+    def blocking_function(*args, **kwargs) -> None:
+        run_coroutine_blocking(coroutine_function, *args, **kwargs)
+    return blocking_function
+
+
+def _as_coroutine_function(function: Callable) -> Callable[..., Coroutine]:
+    async def coroutine_function(*args, **kwargs):
+        return function(*args, **kwargs)
+    return coroutine_function
@@ -0,0 +1,441 @@
+import time
+import threading
+from collections import deque
+from typing import Callable, Any
+from concurrent.futures import Executor
+
+from intercept_it.interceptors.base_interceptor import BaseInterceptor
+from intercept_it.loggers.base_logger import BaseLogger, BaseAsyncLogger
+from intercept_it.utils.checker import arguments_checker
+from intercept_it.utils.rate_limiting import EventsLimiter
+from intercept_it.utils.metrics import InterceptorMetrics
+from intercept_it.utils.background_tasks import BackgroundTasks
+from intercept_it.utils.enums import CircuitStatesEnum, FunctionKindsEnum
+from intercept_it.utils.exceptions import InterceptItCircuitOpenException
+from intercept_it.utils.exceptions_index import ExceptionsIndex
+
+_COROUTINE_FUNCTION = FunctionKindsEnum.COROUTINE_FUNCTION
+
+_CLOSED = CircuitStatesEnum.CLOSED
+_OPEN = CircuitStatesEnum.OPEN
+_HALF_OPEN = CircuitStatesEnum.HALF_OPEN
+
+# Marks that fallback value isn't specified, so ``None`` can be used as a fallback
+_NO_FALLBACK = object()
+
+
+class CircuitBreakerInterceptor(BaseInterceptor):
+    """
+    Intercepts specified exceptions from a function and stops calling it, when exceptions occur too often.
+
+    * CLOSED - Calls are executed. Intercepted exceptions are counted in the sliding time window
+    * OPEN - Calls are rejected without execution until recovery timeout expires
+    * HALF_OPEN - A few trial calls are executed. Success closes the circuit, intercepted exception opens it again
+
+    Not target exceptions don't change the circuit state
+    """
+    _wraps_async_generators = False
+
+    def __init__(
+            self,
+            exceptions: list[type[BaseException]],
+            loggers: list[BaseLogger | BaseAsyncLogger] | None = None,
+            failure_threshold: int = 5,
+            window: int | float = 60,
+            recovery_timeout: int | float = 30,
+            half_open_max_calls: int = 1,
+            fallback: Any = _NO_FALLBACK,
+            raise_exception: bool = False,
+            greed_mode: bool = False,
+            async_mode: bool | None = None,
+            fast_handlers_execution: bool = True,
+            fast_loggers_execution: bool = True,
+            subclass_matching: bool = False,
+            events_limiter: EventsLimiter | None = None,
+            metrics: InterceptorMetrics | None = None,
+            parallel_sync_execution: bool = False,
+            wait_parallel_execution: bool = True,
+            sync_executor: Executor | None = None,
+            background_tasks: BackgroundTasks | None = None,
+            loggers_timeout: int | float | None = None
+    ):
+        """
+        :param exceptions: Collection of target exceptions
+
+        :param loggers: Collection of loggers
+
+        :param failure_threshold: Count of intercepted exceptions in the window, which opens the circuit
+
+        :param window: Duration of the sliding window in seconds
+
+        :param recovery_timeout: Time in seconds, after which the open circuit allows trial calls
+
+        :param half_open_max_calls: Maximum count of concurrent trial calls in the half-open state
+
+        :param fallback: Value returned instead of the rejected call.
+            If not specified, ``InterceptItCircuitOpenException`` is raised
+
+        :param raise_exception: If equals ``True`` interceptor sends all caught exceptions higher up the call stack.
+            If not specified, feature disabled
+
+        :param greed_mode: If equals ``True`` interceptor sends wrapped function parameters
+            to some handlers. If not specified, feature disabled
+
+        :param async_mode: If equals ``True`` interceptor wraps coroutine functions,
+            if equals ``False`` - ordinary functions. If not specified, kind of every function is detected,
+            when it's wrapped. So one interceptor can wrap ordinary functions, coroutine functions and async generators
+
+        :param fast_handlers_execution: If equals ``True`` handlers will be executed as tasks.
+         If equals ``False`` they will be executed in order with ``await`` instruction.
+
+        :param fast_loggers_execution: If equals ``True`` loggers will be executed as tasks.
+         If equals ``False`` they will be executed in order with ``await`` instruction.
+
+        :param subclass_matching: If equals ``True`` interceptor also catches subclasses of the target exceptions.
+            If not specified, only the exact target exceptions are caught
+
+        :param events_limiter: Rate limit and sampling of the intercepted exceptions processing by loggers and handlers.
+            If not specified, all exceptions are processed
+
+        :param metrics: Collector of the interceptor's counters and durations.
+            If not specified, metrics aren't collected
+
+        :param parallel_sync_execution: If equals ``True`` ordinary handlers and loggers are executed in parallel
+            by the executor according to ``fast_handlers_execution`` and ``fast_loggers_execution`` parameters.
+            Exception of one handler doesn't stop others. If not specified, they are executed in order
+
+        :param wait_parallel_execution: If equals ``True`` interceptor waits until parallel handlers and loggers
+            are finished and raises the first exception of them. If equals ``False`` their exceptions are printed
+
+        :param sync_executor: Executor of the parallel handlers and loggers and of the ordinary ones in the async mode.
+            If not specified, the shared one is used in the sync mode and the event loop default one in the async mode
+
+        :param background_tasks: Pool of the background tasks. If specified, loggers and handlers of the coroutines
+            are executed in the background and the wrapper doesn't wait for them
+
+        :param loggers_timeout: Maximum time in seconds of the one logger execution. Async loggers
+            are cancelled, when time is exceeded. Offloaded loggers aren't stopped, only their awaiting
+            is abandoned. If not specified, loggers aren't limited
+        """
+        super().__init__(
+            exceptions=exceptions,
+            loggers=loggers,
+            raise_exception=raise_exception,
+            greed_mode=greed_mode,
+            async_mode=async_mode,
+            fast_handlers_execution=fast_handlers_execution,
+            fast_loggers_execution=fast_loggers_execution,
+            subclass_matching=subclass_matching,
+            events_limiter=events_limiter,
+            metrics=metrics,
+            parallel_sync_execution=parallel_sync_execution,
+            wait_parallel_execution=wait_parallel_execution,
+            sync_executor=sync_executor,
+            background_tasks=background_tasks,
+            loggers_timeout=loggers_timeout
+        )
+        arguments_checker.check_circuit_breaker_parameters(
+            failure_threshold,
+            window,
+            recovery_timeout,
+            half_open_max_calls
+        )
+
+        self._exceptions = exceptions
+        self._matches = ExceptionsIndex(exceptions, subclass_matching)
+        self._raise_exception = raise_exception
+
+        self._failure_threshold = failure_threshold
+        self._window = window
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._fallback = fallback
+
+        self._lock = threading.Lock()
+        self._state = _CLOSED
+        self._failures: deque[float] = deque()
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        # Number of the current half-open period. Trial calls belong to the period, in which they were admitted
+        self._half_open_period = 0
+
+    @property
+    def state(self) -> str:
+        """ Current circuit state: CLOSED, OPEN or HALF_OPEN """
+        return self._state.value
+
+    def reset(self) -> None:
+        """ Closes the circuit and forgets intercepted exceptions """
+        with self._lock:
+            self._close()
+
+    def intercept(self, function: Callable) -> Any:
+        """
+        Exceptions handler of the ``CircuitBreakerInterceptor`` object. Can be used as a decorator without parentheses
+
+        Usage example::
+
+        @circuit_breaker.intercept
+        def request_dependency(number: int, accuracy=0.1) -> float:
+        """
+        if self._function_kind(function) is _COROUTINE_FUNCTION:
+            return self._instrument(self._compile_async_wrapper(function), function)
+        return self._instrument(self._compile_sync_wrapper(function), function)
+
+    def wrap(self, function: Callable, *args, **kwargs) -> Any:
+        """
+        Exceptions handler of the ``CircuitBreakerInterceptor`` object. Can be used as a function with parameters
+
+        Usage example::
+
+        circuit_breaker.wrap(request_dependency, 5, accuracy=0.3)
+
+        :param function: Wrapped function
+        :param args: Positional arguments of the function
+        :param kwargs: Keyword arguments of the function
+        """
+        if not arguments_checker.production_mode:
+            arguments_checker.check_function(function)
+
+        if self._wrapped_kind(function) is _COROUTINE_FUNCTION:
+            if self._metrics is not None:
+                return self._instrumented_async_call(function, self._async_wrapper, function, args, kwargs)
+            return self._async_wrapper(function, args, kwargs)
+        if self._metrics is not None:
+            return self._instrumented_sync_call(function, self._sync_wrapper, function, args, kwargs)
+        return self._sync_wrapper(function, args, kwargs)
+
+    def _compile_sync_wrapper(self, function: Callable) -> Callable:
+        """
+        Generates the wrapper specialized for the interceptor's configuration
+
+        :param function: Wrapped function
+        """
+        breaker = self
+        matches = self._matches
+        targets = matches.targets
+        exact_matching = not self._subclass_matching
+        raise_exception = self._raise_exception
+
+        def wrapper(*args, **kwargs):
+            trial = None
+            if breaker._state is not _CLOSED:
+                allowed, trial = breaker._acquire_call()
+                if not allowed:
+                    return breaker._reject(function)
+
+            try:
+                result = function(*args, **kwargs)
+            except targets as exception:
+                if exact_matching and matches[exception.__class__] is None:
+                    if trial is not None:
+                        breaker._release_call(trial)
+                    raise
+                breaker._record_failure()
+                breaker._sync_chain(function, exception, args, kwargs)
+                if raise_exception:
+                    raise
+                return None
+            except BaseException:
+                if trial is not None:
+                    breaker._release_call(trial)
+                raise
+
+            if trial is not None:
+                breaker._record_success(trial)
+            return result
+        return wrapper
+
+    def _compile_async_wrapper(self, function: Callable) -> Callable:
+        """
+        Generates the coroutine wrapper specialized for the interceptor's configuration
+
+        :param function: Wrapped coroutine function
+        """
+        breaker = self
+        matches = self._matches
+        targets = matches.targets
+        exact_matching = not self._subclass_matching
+        raise_exception = self._raise_exception
+
+        async def wrapper(*args, **kwargs):
+            trial = None
+            if breaker._state is not _CLOSED:
+                allowed, trial = breaker._acquire_call()
+                if not allowed:
+                    return breaker._reject(function)
+
+            try:
+                result = await function(*args, **kwargs)
+            except targets as exception:
+                if exact_matching and matches[exception.__class__] is None:
+                    if trial is not None:
+                        breaker._release_call(trial)
+                    raise
+                breaker._record_failure()
+                await breaker._async_chain(function, exception, args, kwargs)
+                if raise_exception:
+                    raise
+                return None
+            except BaseException:
+                if trial is not None:
+                    breaker._release_call(trial)
+                raise
+
+            if trial is not None:
+                breaker._record_success(trial)
+            return result
+        return wrapper
+
+    def _sync_wrapper(self, function: Callable, args, kwargs) -> Any:
+        """
+        Executes the main control logic of the wrapped function
+
+        :param function: Wrapped function
+        :param args: Positional arguments of the function
+        :param kwargs: Keyword arguments of the function
+        """
+        trial = None
+        if self._state is not _CLOSED:
+            allowed, trial = self._acquire_call()
+            if not allowed:
+                return self._reject(function)
+
+        try:
+            result = function(*args, **kwargs)
+        except self._matches.targets as exception:
+            if self._matches[exception.__class__] is None:
+                if trial is not None:
+                    self._release_call(trial)
+                raise
+
+            self._record_failure()
+            self._sync_chain(function, exception, args, kwargs)
+
+            if self._raise_exception:
+                raise
+            return None
+        except BaseException:
+            if trial is not None:
+                self._release_call(trial)
+            raise
+
+        if trial is not None:
+            self._record_success(trial)
+        return result
+
+    async def _async_wrapper(self, function: Callable, args, kwargs) -> Any:
+        """
+        Executes the main control logic of the wrapped coroutine
+
+        :param function: Wrapped function
+        :param args: Positional arguments of the function
+        :param kwargs: Keyword arguments of the function
+        """
+        trial = None
+        if self._state is not _CLOSED:
+            allowed, trial = self._acquire_call()
+            if not allowed:
+                return self._reject(function)
+
+        try:
+            result = await function(*args, **kwargs)
+        except self._matches.targets as exception:
+            if self._matches[exception.__class__] is None:
+                if trial is not None:
+                    self._release_call(trial)
+                raise
+
+            self._record_failure()
+            await self._async_chain(function, exception, args, kwargs)
+
+            if self._raise_exception:
+                raise
+            return None
+        except BaseException:
+            if trial is not None:
+                self._release_call(trial)
+            raise
+
+        if trial is not None:
+            self._record_success(trial)
+        return result
+
+    def _acquire_call(self) -> tuple[bool, int | None]:
+        """
+        Checks if the call is allowed in the open or half-open state. Moves open circuit to half-open.
+        Returns the permission and the half-open period of the taken trial slot or ``None``,
+        if the circuit was closed and the call isn't a trial
+        """
+        with self._lock:
+            if self._state is _OPEN:
+                if time.monotonic() - self._opened_at < self._recovery_timeout:
+                    return False, None
+                self._state = _HALF_OPEN
+                self._trial_calls = 0
+                self._half_open_period += 1
+
+            if self._state is _HALF_OPEN:
+                if self._trial_calls >= self._half_open_max_calls:
+                    return False, None
+                self._trial_calls += 1
+                return True, self._half_open_period
+            return True, None
+
+    def _record_success(self, trial: int) -> None:
+        """
+        Closes the half-open circuit after the successful trial call
+
+        :param trial: Half-open period of the trial call
+        """
+        with self._lock:
+            if self._state is _HALF_OPEN and self._half_open_period == trial:
+                self._close()
+
+    def _release_call(self, trial: int) -> None:
+        """
+        Frees the trial call slot, when the call is finished by not target exception
+
+        :param trial: Half-open period of the trial call
+        """
+        with self._lock:
+            if self._state is _HALF_OPEN and self._half_open_period == trial and self._trial_calls > 0:
+                self._trial_calls -= 1
+
+    def _record_failure(self) -> None:
+        """ Counts intercepted exception in the sliding window and opens the circuit, if threshold is reached """
+        now = time.monotonic()
+        with self._lock:
+            if self._state is _HALF_OPEN:
+                self._open(now)
+                return
+
+            if self._state is _OPEN:
+                return
+
+            self._failures.append(now)
+            while self._failures[0] <= now - self._window:
+                self._failures.popleft()
+
+            if len(self._failures) >= self._failure_threshold:
+                self._open(now)
+
+    def _open(self, now: float) -> None:
+        self._state = _OPEN
+        self._opened_at = now
+        self._failures.clear()
+
+    def _close(self) -> None:
+        self._state = _CLOSED
+        self._failures.clear()
+        self._trial_calls = 0
+
+    def _reject(self, function: Callable) -> Any:
+        """ Returns fallback value or raises exception instead of the rejected call """
+        if self._metrics is not None:
+            self._metrics.record_rejected(self._function_label(function))
+        if self._fallback is not _NO_FALLBACK:
+            return self._fallback
+        raise InterceptItCircuitOpenException(
+            f'Circuit is {self._state.value}. Call of {getattr(function, "__qualname__", function)} is rejected'
+        )
@@ -1,8 +1,18 @@
 from typing import Callable, Any
+from concurrent.futures import Executor
 
 from intercept_it.interceptors.base_interceptor import BaseInterceptor
 from intercept_it.loggers.base_logger import BaseLogger, BaseAsyncLogger
 from intercept_it.utils.checker import arguments_checker
+from intercept_it.utils.rate_limiting import EventsLimiter
+from intercept_it.utils.metrics import InterceptorMetrics
+from intercept_it.utils.background_tasks import BackgroundTasks
+from intercept_it.utils.enums import FunctionKindsEnum
+from intercept_it.utils.exceptions_index import ExceptionsIndex
+from intercept_it.utils.models import InterceptionLayer
+
+_COROUTINE_FUNCTION = FunctionKindsEnum.COROUTINE_FUNCTION
+_ASYNC_GENERATOR_FUNCTION = FunctionKindsEnum.ASYNC_GENERATOR_FUNCTION
 
 
 class GlobalInterceptor(BaseInterceptor):
@@ -14,9 +24,17 @@ class GlobalInterceptor(BaseInterceptor):
             loggers: list[BaseLogger | BaseAsyncLogger] | None = None,
             raise_exception: bool = False,
             greed_mode: bool = False,
-            async_mode: bool = False,
+            async_mode: bool | None = None,
             fast_handlers_execution: bool = True,
-            fast_loggers_execution: bool = True
+            fast_loggers_execution: bool = True,
+            subclass_matching: bool = False,
+            events_limiter: EventsLimiter | None = None,
+            metrics: InterceptorMetrics | None = None,
+            parallel_sync_execution: bool = False,
+            wait_parallel_execution: bool = True,
+            sync_executor: Executor | None = None,
+            background_tasks: BackgroundTasks | None = None,
+            loggers_timeout: int | float | None = None
     ):
         """
         :param exceptions: Collection of target exceptions
@@ -29,15 +47,41 @@ class GlobalInterceptor(BaseInterceptor):
         :param greed_mode: If equals ``True`` interceptor sends wrapped function parameters
             to some handlers. If not specified, feature disabled
 
-        :param async_mode: If equals ``True`` interceptor can work with coroutines.
-            If not specified, can wrap only ordinary functions.
-            Interceptor can't wrap ordinary function and coroutine at the same time!
+        :param async_mode: If equals ``True`` interceptor wraps coroutine functions,
+            if equals ``False`` - ordinary functions. If not specified, kind of every function is detected,
+            when it's wrapped. So one interceptor can wrap ordinary functions, coroutine functions and async generators
 
         :param fast_handlers_execution: If equals ``True`` handlers will be executed as tasks.
          If equals ``False`` they will be executed in order with ``await`` instruction.
 
         :param fast_loggers_execution: If equals ``True`` loggers will be executed as tasks.
          If equals ``False`` they will be executed in order with ``await`` instruction.
+
+        :param subclass_matching: If equals ``True`` interceptor also catches subclasses of the target exceptions.
+            If not specified, only the exact target exceptions are caught
+
+        :param events_limiter: Rate limit and sampling of the intercepted exceptions processing by loggers and handlers.
+            If not specified, all exceptions are processed
+
+        :param metrics: Collector of the interceptor's counters and durations.
+            If not specified, metrics aren't collected
+
+        :param parallel_sync_execution: If equals ``True`` ordinary handlers and loggers are executed in parallel
+            by the executor according to ``fast_handlers_execution`` and ``fast_loggers_execution`` parameters.
+            Exception of one handler doesn't stop others. If not specified, they are executed in order
+
+        :param wait_parallel_execution: If equals ``True`` interceptor waits until parallel handlers and loggers
+            are finished and raises the first exception of them. If equals ``False`` their exceptions are printed
+
+        :param sync_executor: Executor of the parallel handlers and loggers and of the ordinary ones in the async mode.
+            If not specified, the shared one is used in the sync mode and the event loop default one in the async mode
+
+        :param background_tasks: Pool of the background tasks. If specified, loggers and handlers of the coroutines
+            are executed in the background and the wrapper doesn't wait for them
+
+        :param loggers_timeout: Maximum time in seconds of the one logger execution. Async loggers
+            are cancelled, when time is exceeded. Offloaded loggers aren't stopped, only their awaiting
+            is abandoned. If not specified, loggers aren't limited
         """
         super().__init__(
             exceptions=exceptions,
@@ -46,11 +90,19 @@ class GlobalInterceptor(BaseInterceptor):
             greed_mode=greed_mode,
             async_mode=async_mode,
             fast_handlers_execution=fast_handlers_execution,
-            fast_loggers_execution=fast_loggers_execution
+            fast_loggers_execution=fast_loggers_execution,
+            subclass_matching=subclass_matching,
+            events_limiter=events_limiter,
+            metrics=metrics,
+            parallel_sync_execution=parallel_sync_execution,
+            wait_parallel_execution=wait_parallel_execution,
+            sync_executor=sync_executor,
+            background_tasks=background_tasks,
+            loggers_timeout=loggers_timeout
         )
         self._exceptions = exceptions
+        self._matches = ExceptionsIndex(exceptions, subclass_matching)
         self._raise_exception = raise_exception
-        self.async_mode = async_mode
 
     def intercept(self, function: Callable) -> Any:
         """
@@ -61,13 +113,20 @@ class GlobalInterceptor(BaseInterceptor):
         @global_interceptor.intercept
         def dangerous_function(number: int, accuracy=0.1) -> float:
         """
-        if self.async_mode:
-            async def wrapper(*args, **kwargs):
-                return await self._async_wrapper(function, args, kwargs)
-        else:
-            def wrapper(*args, **kwargs):
-                return self._sync_wrapper(function, args, kwargs)
-        return wrapper
+        kind = self._function_kind(function)
+        layer = InterceptionLayer(self, self._matches, self._raise_exception)
+        flattened = self._flatten(function, kind, layer)
+        if flattened is not None:
+            return flattened
+
+        match kind:
+            case FunctionKindsEnum.COROUTINE_FUNCTION:
+                wrapper = self._compile_async_wrapper(function)
+            case FunctionKindsEnum.ASYNC_GENERATOR_FUNCTION:
+                wrapper = self._compile_async_generator_wrapper(function, self._matches, self._raise_exception)
+            case _:
+                wrapper = self._compile_sync_wrapper(function)
+        return self._complete_wrapper(wrapper, function, kind, layer)
 
     def wrap(self, function: Callable, *args, **kwargs) -> Any:
         """
@@ -81,13 +140,80 @@ class GlobalInterceptor(BaseInterceptor):
         :param args: Positional arguments of the function
         :param kwargs: Keyword arguments of the function
         """
-        arguments_checker.check_function(function)
-        if self.async_mode:
-            async def wrapper():
-                return await self._async_wrapper(function, args, kwargs)
-            return wrapper()
+        if not arguments_checker.production_mode:
+            arguments_checker.check_function(function)
+
+        kind = self._wrapped_kind(function)
+        if kind is _ASYNC_GENERATOR_FUNCTION:
+            return self.intercept(function)(*args, **kwargs)
+        if self._metrics is not None:
+            if kind is _COROUTINE_FUNCTION:
+                return self._instrumented_async_call(function, self._async_wrapper, function, args, kwargs)
+            return self._instrumented_sync_call(function, self._sync_wrapper, function, args, kwargs)
+
+        if kind is _COROUTINE_FUNCTION:
+            return self._async_wrapper(function, args, kwargs)
+        return self._sync_wrapper(function, args, kwargs)
+
+    def _compile_sync_wrapper(self, function: Callable) -> Callable:
+        """
+        Generates the wrapper specialized for the interceptor's configuration
+
+        :param function: Wrapped function
+        """
+        interceptor = self
+        matches = self._matches
+        targets = matches.targets
+        exact_matching = not self._subclass_matching
+
+        if self._raise_exception:
+            def wrapper(*args, **kwargs):
+                try:
+                    return function(*args, **kwargs)
+                except targets as exception:
+                    if exact_matching and matches[exception.__class__] is None:
+                        raise
+                    interceptor._sync_chain(function, exception, args, kwargs)
+                    raise
         else:
-            return self._sync_wrapper(function, args, kwargs)
+            def wrapper(*args, **kwargs):
+                try:
+                    return function(*args, **kwargs)
+                except targets as exception:
+                    if exact_matching and matches[exception.__class__] is None:
+                        raise
+                    interceptor._sync_chain(function, exception, args, kwargs)
+        return wrapper
+
+    def _compile_async_wrapper(self, function: Callable) -> Callable:
+        """
+        Generates the coroutine wrapper specialized for the interceptor's configuration
+
+        :param function: Wrapped coroutine function
+        """
+        interceptor = self
+        matches = self._matches
+        targets = matches.targets
+        exact_matching = not self._subclass_matching
+
+        if self._raise_exception:
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await function(*args, **kwargs)
+                except targets as exception:
+                    if exact_matching and matches[exception.__class__] is None:
+                        raise
+                    await interceptor._async_chain(function, exception, args, kwargs)
+                    raise
+        else:
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await function(*args, **kwargs)
+                except targets as exception:
+                    if exact_matching and matches[exception.__class__] is None:
+                        raise
+                    await interceptor._async_chain(function, exception, args, kwargs)
+        return wrapper
 
     def _sync_wrapper(self, function: Callable, args, kwargs) -> Any:
         """
@@ -99,14 +225,14 @@ class GlobalInterceptor(BaseInterceptor):
         """
         try:
             return function(*args, **kwargs)
-        except BaseException as exception:
-            if exception.__class__ not in self._exceptions:
-                raise exception
+        except self._matches.targets as exception:
+            if self._matches[exception.__class__] is None:
+                raise
 
-            self._execute_sync_handlers(exception, *args, **kwargs)
+            self._sync_chain(function, exception, args, kwargs)
 
             if self._raise_exception:
-                raise exception
+                raise
 
     async def _async_wrapper(self, function: Callable, args, kwargs) -> Any:
         """
@@ -118,11 +244,11 @@ class GlobalInterceptor(BaseInterceptor):
         """
         try:
             return await function(*args, **kwargs)
-        except BaseException as exception:
-            if exception.__class__ not in self._exceptions:
-                raise exception
+        except self._matches.targets as exception:
+            if self._matches[exception.__class__] is None:
+                raise
 
-            await self._execute_async_handlers(exception, *args, **kwargs)
+            await self._async_chain(function, exception, args, kwargs)
 
             if self._raise_exception:
-                raise exception
+                raise
@@ -1,14 +1,28 @@
 import asyncio
 import time
-from typing import Callable, Any
+import warnings
+from functools import partial
+from typing import Callable, Any, Iterator
+from concurrent.futures import Executor, Future, InvalidStateError
 
 from intercept_it.interceptors.base_interceptor import BaseInterceptor
 from intercept_it.loggers.base_logger import BaseLogger, BaseAsyncLogger
 from intercept_it.utils.checker import arguments_checker
+from intercept_it.utils.rate_limiting import EventsLimiter
+from intercept_it.utils.metrics import InterceptorMetrics
+from intercept_it.utils.background_tasks import BackgroundTasks
+from intercept_it.utils.enums import FunctionKindsEnum
+from intercept_it.utils.exceptions_index import ExceptionsIndex
+from intercept_it.utils.backoff_strategies import BaseBackoff, FixedBackoff
+from intercept_it.utils.exceptions import InterceptItSetupException
+from intercept_it.utils.scheduling import shared_executor, shared_scheduler
+
+_COROUTINE_FUNCTION = FunctionKindsEnum.COROUTINE_FUNCTION
 
 
 class LoopedInterceptor(BaseInterceptor):
     """ Intercepts specified exceptions from a function """
+    _wraps_async_generators = False
 
     def __init__(
             self,
@@ -17,31 +31,85 @@ class LoopedInterceptor(BaseInterceptor):
             timeout: int | float = 1,
             greed_mode: bool = False,
             run_until_success: bool = False,
-            async_mode: bool = False,
+            async_mode: bool | None = None,
             fast_handlers_execution: bool = True,
-            fast_loggers_execution: bool = True
+            fast_loggers_execution: bool = True,
+            subclass_matching: bool = False,
+            events_limiter: EventsLimiter | None = None,
+            metrics: InterceptorMetrics | None = None,
+            parallel_sync_execution: bool = False,
+            wait_parallel_execution: bool = True,
+            sync_executor: Executor | None = None,
+            background_tasks: BackgroundTasks | None = None,
+            loggers_timeout: int | float | None = None,
+            backoff: BaseBackoff | None = None,
+            max_attempts: int | None = None,
+            deadline: int | float | None = None,
+            non_blocking: bool = False,
+            executor: Executor | None = None
     ):
         """
         :param exceptions: Collection of target exceptions
 
         :param loggers: Collection of loggers
 
-        :param run_until_success: If equals ``True`` interceptor executes the wrapped function with handlers and loggers
-            until an exception occurs in endless cycle. If not specified, feature disabled.
-            Note that if ``raise_exception`` parameter equals ``True`` the feature also won't work
+        :param timeout: Delay in seconds between attempts. Is used if backoff strategy is not specified
 
         :param greed_mode: If equals ``True`` interceptor sends wrapped function parameters
             to some handlers. If not specified, feature disabled
 
-        :param async_mode: If equals ``True`` interceptor can work with coroutines.
-            If not specified, can wrap only ordinary functions.
-            Interceptor can't wrap ordinary function and coroutine at the same time!
+        :param async_mode: If equals ``True`` interceptor wraps coroutine functions,
+            if equals ``False`` - ordinary functions. If not specified, kind of every function is detected,
+            when it's wrapped. So one interceptor can wrap ordinary functions, coroutine functions and async generators
 
         :param fast_handlers_execution: If equals ``True`` handlers will be executed as tasks.
          If equals ``False`` they will be executed in order with ``await`` instruction.
 
         :param fast_loggers_execution: If equals ``True`` loggers will be executed as tasks.
          If equals ``False`` they will be executed in order with ``await`` instruction.
+
+        :param subclass_matching: If equals ``True`` interceptor also catches subclasses of the target exceptions.
+            If not specified, only the exact target exceptions are caught
+
+        :param events_limiter: Rate limit and sampling of the intercepted exceptions processing by loggers and handlers.
+            If not specified, all exceptions are processed
+
+        :param metrics: Collector of the interceptor's counters and durations.
+            If not specified, metrics aren't collected
+
+        :param parallel_sync_execution: If equals ``True`` ordinary handlers and loggers are executed in parallel
+            by the executor according to ``fast_handlers_execution`` and ``fast_loggers_execution`` parameters.
+            Exception of one handler doesn't stop others. If not specified, they are executed in order
+
+        :param wait_parallel_execution: If equals ``True`` interceptor waits until parallel handlers and loggers
+            are finished and raises the first exception of them. If equals ``False`` their exceptions are printed
+
+        :param sync_executor: Executor of the parallel handlers and loggers and of the ordinary ones in the async mode.
+            If not specified, the shared one is used in the sync mode and the event loop default one in the async mode
+
+        :param background_tasks: Pool of the background tasks. If specified, loggers and handlers of the coroutines
+            are executed in the background and the wrapper doesn't wait for them
+
+        :param loggers_timeout: Maximum time in seconds of the one logger execution. Async loggers
+            are cancelled, when time is exceeded. Offloaded loggers aren't stopped, only their awaiting
+            is abandoned. If not specified, loggers aren't limited
+
+        :param backoff: Strategy of delays between attempts, e.g. ``ExponentialBackoff``.
+            If not specified, interceptor waits ``timeout`` seconds before every attempt
+
+        :param max_attempts: Maximum count of the wrapped function executions during the one call.
+            When attempts are exhausted, the last exception is sent higher up the call stack.
+            If not specified, interceptor retries until success
+
+        :param deadline: Total time budget in seconds of the one call. The last delay is trimmed to the rest
+            of the budget. When time is exhausted, the last exception is sent higher up the call stack.
+            If not specified, interceptor retries until success
+
+        :param non_blocking: If equals ``True`` wrapped functions return ``concurrent.futures.Future``.
+            Attempts are executed by the executor and delays are scheduled by the shared scheduler thread,
+            so no thread sleeps between attempts. Can be used only with ordinary functions
+
+        :param executor: Executor of the attempts in non-blocking mode. If not specified, the shared one is used
         """
         super().__init__(
             exceptions=exceptions,
@@ -50,14 +118,38 @@ class LoopedInterceptor(BaseInterceptor):
             greed_mode=greed_mode,
             async_mode=async_mode,
             fast_handlers_execution=fast_handlers_execution,
-            fast_loggers_execution=fast_loggers_execution
+            fast_loggers_execution=fast_loggers_execution,
+            subclass_matching=subclass_matching,
+            events_limiter=events_limiter,
+            metrics=metrics,
+            parallel_sync_execution=parallel_sync_execution,
+            wait_parallel_execution=wait_parallel_execution,
+            sync_executor=sync_executor,
+            background_tasks=background_tasks,
+            loggers_timeout=loggers_timeout
         )
         arguments_checker.check_timeout(timeout)
+        arguments_checker.check_backoff(backoff)
+        arguments_checker.check_retries_limits(max_attempts, deadline)
+        arguments_checker.check_boolean_arguments({'non_blocking': non_blocking})
+        if non_blocking and async_mode:
+            raise InterceptItSetupException('Non-blocking mode can be used only with ordinary functions')
+        arguments_checker.check_executor(executor)
+        if run_until_success:
+            warnings.warn(
+                'run_until_success parameter is deprecated and ignored. Use max_attempts and deadline to limit retries',
+                DeprecationWarning,
+                stacklevel=2
+            )
 
         self._exceptions = exceptions
-        self._run_until_success = run_until_success
-        self.async_mode = async_mode
+        self._matches = ExceptionsIndex(exceptions, subclass_matching)
         self._timeout = timeout
+        self._backoff = backoff if backoff is not None else FixedBackoff(timeout)
+        self._max_attempts = max_attempts
+        self._deadline = deadline
+        self._non_blocking = non_blocking
+        self._executor = executor
 
     def intercept(self, function: Callable) -> Any:
         """
@@ -68,13 +160,13 @@ class LoopedInterceptor(BaseInterceptor):
         @global_interceptor.intercept
         def dangerous_function(number: int, accuracy=0.1) -> float:
         """
-        if self.async_mode:
-            async def wrapper(*args, **kwargs):
-                return await self._async_wrapper(function, args, kwargs)
-        else:
-            def wrapper(*args, **kwargs):
-                return self._sync_wrapper(function, args, kwargs)
-        return wrapper
+        if self._function_kind(function) is _COROUTINE_FUNCTION:
+            if self._non_blocking:
+                raise InterceptItSetupException('Non-blocking mode can be used only with ordinary functions')
+            return self._instrument(self._compile_async_wrapper(function), function)
+        if self._non_blocking:
+            return self._compile_non_blocking_wrapper(function)
+        return self._instrument(self._compile_sync_wrapper(function), function)
 
     def wrap(self, function: Callable, *args, **kwargs) -> Any:
         """
@@ -88,13 +180,177 @@ class LoopedInterceptor(BaseInterceptor):
         :param args: Positional arguments of the function
         :param kwargs: Keyword arguments of the function
         """
-        arguments_checker.check_function(function)
-        if self.async_mode:
-            async def wrapper():
-                return await self._async_wrapper(function, args, kwargs)
-            return wrapper()
-        else:
-            return self._sync_wrapper(function, args, kwargs)
+        if not arguments_checker.production_mode:
+            arguments_checker.check_function(function)
+
+        if self._wrapped_kind(function) is _COROUTINE_FUNCTION:
+            if self._non_blocking:
+                raise InterceptItSetupException('Non-blocking mode can be used only with ordinary functions')
+            if self._metrics is not None:
+                return self._instrumented_async_call(function, self._async_wrapper, function, args, kwargs)
+            return self._async_wrapper(function, args, kwargs)
+        if self._non_blocking:
+            return self._submit_call(function, args, kwargs)
+        if self._metrics is not None:
+            return self._instrumented_sync_call(function, self._sync_wrapper, function, args, kwargs)
+        return self._sync_wrapper(function, args, kwargs)
+
+    def _compile_sync_wrapper(self, function: Callable) -> Callable:
+        """
+        Generates the wrapper specialized for the interceptor's configuration
+
+        :param function: Wrapped function
+        """
+        interceptor = self
+        matches = self._matches
+        targets = matches.targets
+        exact_matching = not self._subclass_matching
+        backoff = self._backoff
+        metrics = self._metrics
+        label = self._function_label(function) if metrics is not None else None
+
+        def wrapper(*args, **kwargs):
+            started = time.monotonic()
+            attempt = 0
+            delays = None
+            while True:
+                try:
+                    return function(*args, **kwargs)
+                except targets as exception:
+                    if exact_matching and matches[exception.__class__] is None:
+                        raise
+                    interceptor._sync_chain(function, exception, args, kwargs)
+
+                    attempt += 1
+                    if delays is None:
+                        delays = backoff.delays()
+                    delay = interceptor._retry_delay(attempt, delays, started)
+                    if delay is None:
+                        raise
+                    if metrics is not None:
+                        metrics.record_retry(label)
+
+                time.sleep(delay)
+        return wrapper
+
+    def _compile_async_wrapper(self, function: Callable) -> Callable:
+        """
+        Generates the coroutine wrapper specialized for the interceptor's configuration
+
+        :param function: Wrapped coroutine function
+        """
+        interceptor = self
+        matches = self._matches
+        targets = matches.targets
+        exact_matching = not self._subclass_matching
+        backoff = self._backoff
+        metrics = self._metrics
+        label = self._function_label(function) if metrics is not None else None
+
+        async def wrapper(*args, **kwargs):
+            started = time.monotonic()
+            attempt = 0
+            delays = None
+            while True:
+                try:
+                    return await function(*args, **kwargs)
+                except asyncio.CancelledError:
+                    # Cancelled calls are never retried
+                    raise
+                except targets as exception:
+                    if exact_matching and matches[exception.__class__] is None:
+                        raise
+                    await interceptor._async_chain(function, exception, args, kwargs)
+
+                    attempt += 1
+                    if delays is None:
+                        delays = backoff.delays()
+                    delay = interceptor._retry_delay(attempt, delays, started)
+                    if delay is None:
+                        raise
+                    if metrics is not None:
+                        metrics.record_retry(label)
+
+                await asyncio.sleep(delay)
+        return wrapper
+
+    def _compile_non_blocking_wrapper(self, function: Callable) -> Callable:
+        """
+        Generates the wrapper, which returns ``Future`` of the wrapped function result
+
+        :param function: Wrapped function
+        """
+        interceptor = self
+
+        def wrapper(*args, **kwargs):
+            return interceptor._submit_call(function, args, kwargs)
+        return wrapper
+
+    def _submit_call(self, function: Callable, args, kwargs) -> Future:
+        """
+        Submits the first attempt of the call to the executor. Next attempts are scheduled after delays
+
+        :param function: Wrapped function
+        :param args: Positional arguments of the function
+        :param kwargs: Keyword arguments of the function
+        :return: Future of the wrapped function result
+        """
+        future = Future()
+        label = None
+        if self._metrics is not None:
+            label = self._function_label(function)
+            self._metrics.record_call(label)
+            future.add_done_callback(partial(_record_raised, self._metrics, label))
+
+        executor = self._executor or shared_executor()
+        scheduler = shared_scheduler()
+        started = time.monotonic()
+        attempt = 0
+        delays = None
+
+        def execute_attempt() -> None:
+            nonlocal attempt, delays
+            if future.cancelled():
+                return
+
+            try:
+                result = function(*args, **kwargs)
+            except self._matches.targets as exception:
+                if self._matches[exception.__class__] is None:
+                    _set_exception(future, exception)
+                    return
+
+                try:
+                    self._sync_chain(function, exception, args, kwargs)
+                except BaseException as handler_exception:
+                    _set_exception(future, handler_exception)
+                    return
+
+                attempt += 1
+                if delays is None:
+                    delays = self._backoff.delays()
+                delay = self._retry_delay(attempt, delays, started)
+                if delay is None:
+                    _set_exception(future, exception)
+                    return
+                if self._metrics is not None:
+                    self._metrics.record_retry(label)
+
+                scheduler.schedule(delay, submit_attempt)
+            except BaseException as exception:
+                _set_exception(future, exception)
+            else:
+                _set_result(future, result)
+
+        def submit_attempt() -> None:
+            try:
+                executor.submit(execute_attempt)
+            except RuntimeError as exception:
+                # Executor is shut down
+                _set_exception(future, exception)
+
+        submit_attempt()
+        return future
 
     def _sync_wrapper(self, function: Callable, args, kwargs) -> Any:
         """
@@ -104,16 +360,28 @@ class LoopedInterceptor(BaseInterceptor):
         :param args: Positional arguments of the function
         :param kwargs: Keyword arguments of the function
         """
+        started = time.monotonic()
+        attempt = 0
+        delays = None
         while True:
             try:
                 return function(*args, **kwargs)
-            except BaseException as exception:
-                if exception.__class__ not in self._exceptions:
-                    raise exception
+            except self._matches.targets as exception:
+                if self._matches[exception.__class__] is None:
+                    raise
+
+                self._sync_chain(function, exception, args, kwargs)
 
-                self._execute_sync_handlers(exception, *args, **kwargs)
+                attempt += 1
+                if delays is None:
+                    delays = self._backoff.delays()
+                delay = self._retry_delay(attempt, delays, started)
+                if delay is None:
+                    raise
+                if self._metrics is not None:
+                    self._metrics.record_retry(self._function_label(function))
 
-            time.sleep(self._timeout)
+            time.sleep(delay)
 
     async def _async_wrapper(self, function: Callable, args, kwargs) -> Any:
         """
@@ -123,13 +391,69 @@ class LoopedInterceptor(BaseInterceptor):
         :param args: Positional arguments of the function
         :param kwargs: Keyword arguments of the function
         """
+        started = time.monotonic()
+        attempt = 0
+        delays = None
         while True:
             try:
                 return await function(*args, **kwargs)
-            except BaseException as exception:
-                if exception.__class__ not in self._exceptions:
-                    raise exception
+            except asyncio.CancelledError:
+                raise
+            except self._matches.targets as exception:
+                if self._matches[exception.__class__] is None:
+                    raise
+
+                await self._async_chain(function, exception, args, kwargs)
+
+                attempt += 1
+                if delays is None:
+                    delays = self._backoff.delays()
+                delay = self._retry_delay(attempt, delays, started)
+                if delay is None:
+                    raise
+                if self._metrics is not None:
+                    self._metrics.record_retry(self._function_label(function))
+
+            await asyncio.sleep(delay)
+
+    def _retry_delay(self, attempt: int, delays: Iterator[float], started: float) -> float | None:
+        """
+        Calculates delay before the next attempt. Trims it to the rest of the deadline
+
+        :param attempt: Count of failed attempts
+        :param delays: Delays iterator of the current call
+        :param started: Monotonic time of the call start
+        :return: Delay in seconds or ``None`` if attempts or time are exhausted
+        """
+        if self._max_attempts is not None and attempt >= self._max_attempts:
+            return None
+
+        delay = next(delays)
+        if self._deadline is not None:
+            remaining = started + self._deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            delay = min(delay, remaining)
+        return delay
+
+
+def _record_raised(metrics: InterceptorMetrics, function: str, future: Future) -> None:
+    """ Counts exception of the finished non-blocking call """
+    if not future.cancelled() and future.exception() is not None:
+        metrics.record_raised(function)
+
+
+def _set_result(future: Future, result: Any) -> None:
+    """ Sets result of the future, if it wasn't cancelled """
+    try:
+        future.set_result(result)
+    except InvalidStateError:
+        pass
 
-                await self._execute_async_handlers(exception, *args, **kwargs)
 
-            await asyncio.sleep(self._timeout)
+def _set_exception(future: Future, exception: BaseException) -> None:
+    """ Sets exception of the future, if it wasn't cancelled """
+    try:
+        future.set_exception(exception)
+    except InvalidStateError:
+        pass
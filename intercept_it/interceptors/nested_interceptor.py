@@ -6,6 +6,7 @@ from intercept_it.interceptors.base_interceptor import BaseInterceptor
 from intercept_it.interceptors.unit_interceptor import UnitInterceptor
 from intercept_it.interceptors.global_interceptor import GlobalInterceptor
 from intercept_it.interceptors.looped_interceptor import LoopedInterceptor
+from intercept_it.interceptors.circuit_breaker_interceptor import CircuitBreakerInterceptor
 
 
 class NestedInterceptor:
@@ -14,7 +15,7 @@ class NestedInterceptor:
             self,
             interceptors: dict[
                 int | str | type[BaseException],
-                UnitInterceptor | GlobalInterceptor | LoopedInterceptor
+                UnitInterceptor | GlobalInterceptor | LoopedInterceptor | CircuitBreakerInterceptor
             ]
     ):
         """
@@ -24,41 +25,22 @@ class NestedInterceptor:
         self.interceptors = interceptors
 
     def intercept(self, group_id: int | str | type[BaseException]) -> Any:
+        arguments_checker.check_group_existence(group_id, self.interceptors)
+
         def outer(function):
-            arguments_checker.check_group_existence(group_id, self.interceptors)
             interceptor = self.interceptors.get(group_id)
 
             if isinstance(interceptor, UnitInterceptor):
-                if interceptor.async_mode:
-                    async def async_wrapper():
-                        return await interceptor.intercept(group_id)(function)
-                    return async_wrapper
-                
                 return interceptor.intercept(group_id)(function)
-            else:
-                if interceptor.async_mode:
-                    async def async_wrapper():
-                        return await interceptor.intercept(function)
-                    return async_wrapper
-                    
-                return interceptor.intercept(function)
+            return interceptor.intercept(function)
         return outer
 
     def wrap(self, function: Callable, group_id: int | str | type[BaseException], *args, **kwargs) -> Any:
-        arguments_checker.check_group_existence(group_id, self.interceptors)
+        if not arguments_checker.production_mode:
+            arguments_checker.check_group_existence(group_id, self.interceptors)
+
         interceptor = self.interceptors.get(group_id)
 
         if isinstance(interceptor, UnitInterceptor):
-            if interceptor.async_mode:
-                async def async_wrapper():
-                    return await interceptor.wrap(function, group_id, *args, **kwargs)
-                return async_wrapper
-
             return interceptor.wrap(function, group_id, *args, **kwargs)
-        else:
-            if interceptor.async_mode:
-                async def async_wrapper():
-                    return await interceptor.wrap(function, *args, **kwargs)
-                return async_wrapper
-
-            return interceptor.wrap(function, *args, **kwargs)
+        return interceptor.wrap(function, *args, **kwargs)
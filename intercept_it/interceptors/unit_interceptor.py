@@ -1,8 +1,18 @@
 from typing import Callable, Any
+from concurrent.futures import Executor
 
 from intercept_it.interceptors.base_interceptor import BaseInterceptor
 from intercept_it.loggers.base_logger import BaseLogger, BaseAsyncLogger
 from intercept_it.utils.checker import arguments_checker
+from intercept_it.utils.enums import FunctionKindsEnum
+from intercept_it.utils.exceptions_index import ExceptionsIndex
+from intercept_it.utils.models import InterceptionLayer
+from intercept_it.utils.rate_limiting import EventsLimiter
+from intercept_it.utils.metrics import InterceptorMetrics
+from intercept_it.utils.background_tasks import BackgroundTasks
+
+_COROUTINE_FUNCTION = FunctionKindsEnum.COROUTINE_FUNCTION
+_ASYNC_GENERATOR_FUNCTION = FunctionKindsEnum.ASYNC_GENERATOR_FUNCTION
 
 
 class UnitInterceptor(BaseInterceptor):
@@ -12,9 +22,17 @@ class UnitInterceptor(BaseInterceptor):
             loggers: list[BaseLogger | BaseAsyncLogger] | None = None,
             raise_exception: bool = False,
             greed_mode: bool = False,
-            async_mode: bool = False,
+            async_mode: bool | None = None,
             fast_handlers_execution: bool = True,
-            fast_loggers_execution: bool = True
+            fast_loggers_execution: bool = True,
+            subclass_matching: bool = False,
+            events_limiter: EventsLimiter | None = None,
+            metrics: InterceptorMetrics | None = None,
+            parallel_sync_execution: bool = False,
+            wait_parallel_execution: bool = True,
+            sync_executor: Executor | None = None,
+            background_tasks: BackgroundTasks | None = None,
+            loggers_timeout: int | float | None = None
     ):
         """
         :param loggers: Collection of loggers
@@ -25,15 +43,41 @@ class UnitInterceptor(BaseInterceptor):
         :param greed_mode: If equals ``True`` interceptor sends wrapped function parameters
             to some handlers. If not specified, feature disabled
 
-        :param async_mode: If equals ``True`` interceptor can work with coroutines.
-            If not specified, can wrap only ordinary functions.
-            Interceptor can't wrap ordinary function and coroutine at the same time!
+        :param async_mode: If equals ``True`` interceptor wraps coroutine functions,
+            if equals ``False`` - ordinary functions. If not specified, kind of every function is detected,
+            when it's wrapped. So one interceptor can wrap ordinary functions, coroutine functions and async generators
 
         :param fast_handlers_execution: If equals ``True`` handlers will be executed as tasks.
          If equals ``False`` they will be executed in order with ``await`` instruction.
 
         :param fast_loggers_execution: If equals ``True`` loggers will be executed as tasks.
          If equals ``False`` they will be executed in order with ``await`` instruction.
+
+        :param subclass_matching: If equals ``True`` interceptor also catches subclasses of the target exceptions.
+            If not specified, only the exact target exceptions are caught
+
+        :param events_limiter: Rate limit and sampling of the intercepted exceptions processing by loggers and handlers.
+            If not specified, all exceptions are processed
+
+        :param metrics: Collector of the interceptor's counters and durations.
+            If not specified, metrics aren't collected
+
+        :param parallel_sync_execution: If equals ``True`` ordinary handlers and loggers are executed in parallel
+            by the executor according to ``fast_handlers_execution`` and ``fast_loggers_execution`` parameters.
+            Exception of one handler doesn't stop others. If not specified, they are executed in order
+
+        :param wait_parallel_execution: If equals ``True`` interceptor waits until parallel handlers and loggers
+            are finished and raises the first exception of them. If equals ``False`` their exceptions are printed
+
+        :param sync_executor: Executor of the parallel handlers and loggers and of the ordinary ones in the async mode.
+            If not specified, the shared one is used in the sync mode and the event loop default one in the async mode
+
+        :param background_tasks: Pool of the background tasks. If specified, loggers and handlers of the coroutines
+            are executed in the background and the wrapper doesn't wait for them
+
+        :param loggers_timeout: Maximum time in seconds of the one logger execution. Async loggers
+            are cancelled, when time is exceeded. Offloaded loggers aren't stopped, only their awaiting
+            is abandoned. If not specified, loggers aren't limited
         """
         super().__init__(
             loggers=loggers,
@@ -41,10 +85,17 @@ class UnitInterceptor(BaseInterceptor):
             greed_mode=greed_mode,
             async_mode=async_mode,
             fast_handlers_execution=fast_handlers_execution,
-            fast_loggers_execution=fast_loggers_execution
+            fast_loggers_execution=fast_loggers_execution,
+            subclass_matching=subclass_matching,
+            events_limiter=events_limiter,
+            metrics=metrics,
+            parallel_sync_execution=parallel_sync_execution,
+            wait_parallel_execution=wait_parallel_execution,
+            sync_executor=sync_executor,
+            background_tasks=background_tasks,
+            loggers_timeout=loggers_timeout
         )
         self._raise_exception = raise_exception
-        self.async_mode = async_mode
 
     def intercept(self, exception: type[BaseException]) -> Any:
         """
@@ -57,15 +108,24 @@ class UnitInterceptor(BaseInterceptor):
 
         :param exception: Target exception
         """
+        arguments_checker.check_exceptions((exception,))
+
         def outer(function):
-            arguments_checker.check_exceptions([exception])
-            if self.async_mode:
-                async def wrapper(*args, **kwargs):
-                    return await self._async_wrapper(function, exception, args, kwargs)
-            else:
-                def wrapper(*args, **kwargs):
-                    return self._sync_wrapper(function, exception, args, kwargs)
-            return wrapper
+            kind = self._function_kind(function)
+            matches = ExceptionsIndex([exception], self._subclass_matching)
+            layer = InterceptionLayer(self, matches, self._raise_exception)
+            flattened = self._flatten(function, kind, layer)
+            if flattened is not None:
+                return flattened
+
+            match kind:
+                case FunctionKindsEnum.COROUTINE_FUNCTION:
+                    wrapper = self._compile_async_wrapper(function, exception)
+                case FunctionKindsEnum.ASYNC_GENERATOR_FUNCTION:
+                    wrapper = self._compile_async_generator_wrapper(function, matches, self._raise_exception)
+                case _:
+                    wrapper = self._compile_sync_wrapper(function, exception)
+            return self._complete_wrapper(wrapper, function, kind, layer)
         return outer
 
     def wrap(self, function: Callable, exception: type[BaseException], *args, **kwargs) -> Any:
@@ -81,14 +141,81 @@ class UnitInterceptor(BaseInterceptor):
         :param args: Positional arguments of the function
         :param kwargs: Keyword arguments of the function
         """
-        arguments_checker.check_function(function)
-        arguments_checker.check_exceptions([exception])
-        if self.async_mode:
-            async def wrapper():
-                return await self._async_wrapper(function, exception, args, kwargs)
-            return wrapper()
+        if not arguments_checker.production_mode:
+            arguments_checker.check_function(function)
+            arguments_checker.check_exceptions((exception,))
+
+        kind = self._wrapped_kind(function)
+        if kind is _ASYNC_GENERATOR_FUNCTION:
+            return self.intercept(exception)(function)(*args, **kwargs)
+        if self._metrics is not None:
+            if kind is _COROUTINE_FUNCTION:
+                return self._instrumented_async_call(
+                    function, self._async_wrapper, function, exception, args, kwargs
+                )
+            return self._instrumented_sync_call(function, self._sync_wrapper, function, exception, args, kwargs)
+
+        if kind is _COROUTINE_FUNCTION:
+            return self._async_wrapper(function, exception, args, kwargs)
+        return self._sync_wrapper(function, exception, args, kwargs)
+
+    def _compile_sync_wrapper(self, function: Callable, target_exception: type[BaseException]) -> Callable:
+        """
+        Generates the wrapper specialized for the interceptor's configuration
+
+        :param function: Wrapped function
+        :param target_exception: Target exception
+        """
+        interceptor = self
+        exact_matching = not self._subclass_matching
+
+        if self._raise_exception:
+            def wrapper(*args, **kwargs):
+                try:
+                    return function(*args, **kwargs)
+                except target_exception as exception:
+                    if exact_matching and exception.__class__ is not target_exception:
+                        raise
+                    interceptor._sync_chain(function, exception, args, kwargs)
+                    raise
+        else:
+            def wrapper(*args, **kwargs):
+                try:
+                    return function(*args, **kwargs)
+                except target_exception as exception:
+                    if exact_matching and exception.__class__ is not target_exception:
+                        raise
+                    interceptor._sync_chain(function, exception, args, kwargs)
+        return wrapper
+
+    def _compile_async_wrapper(self, function: Callable, target_exception: type[BaseException]) -> Callable:
+        """
+        Generates the coroutine wrapper specialized for the interceptor's configuration
+
+        :param function: Wrapped coroutine function
+        :param target_exception: Target exception
+        """
+        interceptor = self
+        exact_matching = not self._subclass_matching
+
+        if self._raise_exception:
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await function(*args, **kwargs)
+                except target_exception as exception:
+                    if exact_matching and exception.__class__ is not target_exception:
+                        raise
+                    await interceptor._async_chain(function, exception, args, kwargs)
+                    raise
         else:
-            return self._sync_wrapper(function, exception, args, kwargs)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await function(*args, **kwargs)
+                except target_exception as exception:
+                    if exact_matching and exception.__class__ is not target_exception:
+                        raise
+                    await interceptor._async_chain(function, exception, args, kwargs)
+        return wrapper
 
     def _sync_wrapper(self, function: Callable, target_exception: type[BaseException], args, kwargs) -> Any:
         """
@@ -101,30 +228,31 @@ class UnitInterceptor(BaseInterceptor):
         """
         try:
             return function(*args, **kwargs)
-        except BaseException as exception:
-            if exception.__class__ != target_exception:
-                raise exception
+        except target_exception as exception:
+            if not self._subclass_matching and exception.__class__ is not target_exception:
+                raise
 
-            self._execute_sync_handlers(exception, *args, **kwargs)
+            self._sync_chain(function, exception, args, kwargs)
 
             if self._raise_exception:
-                raise exception
+                raise
 
     async def _async_wrapper(self, function: Callable, target_exception: type[BaseException], args, kwargs) -> Any:
         """
         Executes the main control logic of the wrapped coroutine
 
         :param function: Wrapped function
+        :param target_exception: Target exception
         :param args: Positional arguments of the function
         :param kwargs: Keyword arguments of the function
         """
         try:
             return await function(*args, **kwargs)
-        except BaseException as exception:
-            if exception.__class__ != target_exception:
-                raise exception
+        except target_exception as exception:
+            if not self._subclass_matching and exception.__class__ is not target_exception:
+                raise
 
-            await self._execute_async_handlers(exception, *args, **kwargs)
+            await self._async_chain(function, exception, args, kwargs)
 
             if self._raise_exception:
-                raise exception
+                raise
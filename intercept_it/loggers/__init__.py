@@ -1 +1,30 @@
-from intercept_it.loggers.std_logger import STDLogger
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from intercept_it.loggers.std_logger import STDLogger
+    from intercept_it.loggers.queued_logger import QueuedLogger
+    from intercept_it.loggers.buffered_logger import BufferedAsyncLogger
+
+# Loggers are imported on the first access. ``STDLogger`` imports loguru and pytz
+_LAZY_ATTRIBUTES = {
+    'STDLogger': 'intercept_it.loggers.std_logger',
+    'QueuedLogger': 'intercept_it.loggers.queued_logger',
+    'BufferedAsyncLogger': 'intercept_it.loggers.buffered_logger',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    attribute = getattr(import_module(module), name)
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -2,7 +2,15 @@ from abc import ABC, abstractmethod
 
 
 class BaseLogger(ABC):
-    """ Logger interface """
+    """
+    Logger interface. By default, logger receives the exception message.
+    If ``structured`` attribute equals ``True`` logger receives ``InterceptedEvent`` object.
+    If ``blocking`` attribute equals ``False`` asynchronous interceptors call the logger in the event loop thread
+    instead of the executor
+    """
+    structured: bool = False
+    blocking: bool = True
+
     @staticmethod
     @abstractmethod
     def save_logs(message: str) -> None:
@@ -14,3 +22,13 @@ class BaseAsyncLogger(BaseLogger):
     @staticmethod
     async def save_logs(message: str) -> None:
         pass
+
+
+class BaseAsyncBatchLogger(BaseAsyncLogger):
+    """ Async logger interface, which can save a few messages at once """
+    @abstractmethod
+    async def save_logs_batch(self, messages: list[str]) -> None:
+        pass
+
+    async def save_logs(self, message: str) -> None:
+        await self.save_logs_batch([message])
@@ -0,0 +1,154 @@
+import sys
+import asyncio
+import traceback
+from collections import deque
+
+from intercept_it.utils.enums import OverflowPoliciesEnum
+from intercept_it.utils.exceptions import InterceptItSetupException
+from intercept_it.loggers.base_logger import BaseAsyncLogger, BaseAsyncBatchLogger
+
+
+class BufferedAsyncLogger(BaseAsyncLogger):
+    """
+    Collects logs in the bounded buffer and sends them to the batch logger by batches.
+    The buffer is flushed when it collects ``max_batch_size`` messages or every ``flush_interval`` seconds
+    """
+    structured = True
+
+    def __init__(
+            self,
+            logger: BaseAsyncBatchLogger,
+            max_batch_size: int = 500,
+            flush_interval: int | float = 1,
+            max_buffer_size: int = 10000,
+            overflow_policy: str = OverflowPoliciesEnum.BLOCK.value
+    ):
+        """
+        Supported overflow policies:
+
+        * BLOCK - Waits until the buffer is flushed
+        * DROP_NEWEST - Drops the received message
+        * DROP_OLDEST - Drops the oldest message in the buffer
+
+        :param logger: Wrapped batch logger
+        :param max_batch_size: Maximum count of messages in one batch
+        :param flush_interval: Maximum time in seconds between the message receiving and its sending
+        :param max_buffer_size: Maximum count of unsent messages
+        :param overflow_policy: One of the supported overflow policies
+        """
+        self._logger = logger
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._max_buffer_size = max_buffer_size
+        self._overflow_policy = overflow_policy
+        self._buffer: deque[str] = deque()
+
+        self._flusher: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._has_space: asyncio.Event | None = None
+        self._writing: asyncio.Lock | None = None
+        self._closing = False
+        self._closed = False
+
+        self.dropped = 0
+        self.failed = 0
+
+        self._check_parameters()
+
+    async def save_logs(self, message: str) -> None:
+        """ Puts message to the buffer according to overflow policy. Messages received after closing are dropped """
+        if self._closed:
+            self.dropped += 1
+            return
+
+        self._start_flusher()
+
+        if len(self._buffer) >= self._max_buffer_size:
+            match self._overflow_policy:
+                case OverflowPoliciesEnum.BLOCK.value:
+                    while len(self._buffer) >= self._max_buffer_size:
+                        self._has_space.clear()
+                        self._wakeup.set()
+                        await self._has_space.wait()
+                        if self._closed:
+                            self.dropped += 1
+                            return
+                case OverflowPoliciesEnum.DROP_NEWEST.value:
+                    self.dropped += 1
+                    return
+                case OverflowPoliciesEnum.DROP_OLDEST.value:
+                    self._buffer.popleft()
+                    self.dropped += 1
+
+        self._buffer.append(message)
+        if len(self._buffer) >= self._max_batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """ Sends all buffered messages """
+        if self._writing is None:
+            # Nothing was buffered yet
+            return
+
+        async with self._writing:
+            while self._buffer:
+                batch = [self._buffer.popleft() for _ in range(min(self._max_batch_size, len(self._buffer)))]
+                if not self._logger.structured:
+                    batch = [str(message) for message in batch]
+                self._has_space.set()
+                try:
+                    await self._logger.save_logs_batch(batch)
+                except Exception:
+                    self.failed += len(batch)
+                    traceback.print_exc(file=sys.stderr)
+
+    async def aclose(self) -> None:
+        """
+        Stops the background flushing and sends all buffered messages.
+        The batch, which is being sent by the background flushing, is delivered before the stop.
+        Closed logger doesn't accept messages anymore
+        """
+        self._closed = True
+        if self._flusher is not None:
+            self._closing = True
+            self._wakeup.set()
+            await self._flusher
+            self._flusher = None
+        await self.flush()
+
+    def _start_flusher(self) -> None:
+        """ Starts the background flushing in the running event loop """
+        if self._flusher is not None and not self._flusher.done():
+            return
+
+        self._wakeup = asyncio.Event()
+        self._has_space = asyncio.Event()
+        self._writing = asyncio.Lock()
+        self._closing = False
+        self._flusher = asyncio.get_running_loop().create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def _check_parameters(self) -> None:
+        """ Checks if invalid buffer parameters received """
+        if not isinstance(self._logger, BaseAsyncBatchLogger):
+            raise InterceptItSetupException(
+                f'Wrong logger subclass: {self._logger.__class__.__name__}. It must implements BaseAsyncBatchLogger class'
+            )
+
+        if self._max_batch_size < 1 or self._max_buffer_size < self._max_batch_size:
+            raise InterceptItSetupException('Buffer size must be greater than or equal to positive batch size')
+
+        if self._overflow_policy not in (
+            OverflowPoliciesEnum.BLOCK.value,
+            OverflowPoliciesEnum.DROP_NEWEST.value,
+            OverflowPoliciesEnum.DROP_OLDEST.value
+        ):
+            raise InterceptItSetupException(f'Encountered unsupported overflow policy: {self._overflow_policy}')
@@ -0,0 +1,142 @@
+import sys
+import atexit
+import queue
+import threading
+import traceback
+
+from intercept_it.utils.enums import OverflowPoliciesEnum
+from intercept_it.utils.exceptions import InterceptItSetupException
+from intercept_it.loggers.base_logger import BaseLogger, BaseAsyncLogger
+
+_STOP = object()
+
+
+class QueuedLogger(BaseLogger):
+    """
+    Pushes logs to the bounded queue and delivers them to the wrapped loggers from the dedicated worker thread.
+    The thread, which caught the exception, doesn't wait for slow sinks and message formatting
+    """
+    structured = True
+
+    def __init__(
+            self,
+            loggers: list[BaseLogger],
+            max_queue_size: int = 10000,
+            overflow_policy: str = OverflowPoliciesEnum.BLOCK.value
+    ):
+        """
+        Supported overflow policies:
+
+        * BLOCK - Waits for a free place in the queue
+        * DROP_NEWEST - Drops the received message
+        * DROP_OLDEST - Drops the oldest message in the queue
+
+        :param loggers: Collection of wrapped ordinary loggers. Async loggers aren't supported
+        :param max_queue_size: Maximum positive count of undelivered messages
+        :param overflow_policy: One of the supported overflow policies
+        """
+        self._loggers = tuple(loggers)
+        self._overflow_policy = overflow_policy
+
+        self._check_loggers()
+        self._check_overflow_policy()
+        self._check_queue_size(max_queue_size)
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._closed = False
+
+        self.dropped = 0
+        self.failed = 0
+        # Only the full queue with the BLOCK policy can make the caller wait
+        self.blocking = overflow_policy == OverflowPoliciesEnum.BLOCK.value
+
+        self._worker = threading.Thread(target=self._deliver_logs, name='intercept-it-queued-logger', daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def save_logs(self, message: str) -> None:
+        """ Puts message to the queue according to overflow policy """
+        if self._closed:
+            self.dropped += 1
+            return
+
+        match self._overflow_policy:
+            case OverflowPoliciesEnum.BLOCK.value:
+                self._queue.put(message)
+            case OverflowPoliciesEnum.DROP_NEWEST.value:
+                try:
+                    self._queue.put_nowait(message)
+                except queue.Full:
+                    self.dropped += 1
+            case OverflowPoliciesEnum.DROP_OLDEST.value:
+                while True:
+                    try:
+                        self._queue.put_nowait(message)
+                        return
+                    except queue.Full:
+                        self._drop_oldest()
+
+    def flush(self) -> None:
+        """ Waits until all queued messages are delivered """
+        self._queue.join()
+
+    def close(self) -> None:
+        """ Delivers queued messages and stops the worker thread """
+        if self._closed:
+            return
+
+        self._closed = True
+        self._queue.put(_STOP)
+        self._worker.join()
+
+    def _drop_oldest(self) -> None:
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            return
+        self._queue.task_done()
+        self.dropped += 1
+
+    def _deliver_logs(self) -> None:
+        """ Worker thread loop. Errors of the wrapped loggers don't stop the delivery """
+        while True:
+            message = self._queue.get()
+            try:
+                if message is _STOP:
+                    return
+                for logger in self._loggers:
+                    try:
+                        logger.save_logs(message if logger.structured else str(message))
+                    except Exception:
+                        self.failed += 1
+                        traceback.print_exc(file=sys.stderr)
+            finally:
+                self._queue.task_done()
+
+    def _check_loggers(self) -> None:
+        """ Checks if all of wrapped loggers are ordinary subclasses of the ``BaseLogger`` """
+        for logger in self._loggers:
+            if not isinstance(logger, BaseLogger):
+                raise InterceptItSetupException(
+                    f'Wrong logger subclass: {logger.__class__.__name__}. It must implements BaseLogger class'
+                )
+            # Worker thread calls loggers without awaiting, so coroutines would be discarded
+            if isinstance(logger, BaseAsyncLogger):
+                raise InterceptItSetupException(
+                    f'Async logger {logger.__class__.__name__} can\'t be wrapped. Use BufferedAsyncLogger instead'
+                )
+
+    def _check_overflow_policy(self) -> None:
+        """ Checks if invalid overflow policy received """
+        if self._overflow_policy not in (
+            OverflowPoliciesEnum.BLOCK.value,
+            OverflowPoliciesEnum.DROP_NEWEST.value,
+            OverflowPoliciesEnum.DROP_OLDEST.value
+        ):
+            raise InterceptItSetupException(f'Encountered unsupported overflow policy: {self._overflow_policy}')
+
+    @staticmethod
+    def _check_queue_size(max_queue_size: int) -> None:
+        """ Checks if the queue is bounded. Queue with non-positive size is unbounded """
+        if not isinstance(max_queue_size, int) or isinstance(max_queue_size, bool) or max_queue_size < 1:
+            raise InterceptItSetupException(f'Wrong value {max_queue_size!r} for max_queue_size. Expected positive int')
@@ -1,23 +1,48 @@
 import sys
+import copy
 import pytz
 
-from datetime import datetime
-from loguru import logger
+from datetime import tzinfo
+from loguru._logger import Core, Logger
 from typing import Callable
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from intercept_it.utils.enums import WarningLevelsEnum
 from intercept_it.utils.exceptions import InterceptItSetupException
 from intercept_it.utils.default_formatters import std_formatter
 from intercept_it.loggers.base_logger import BaseLogger
 
+# Loguru logger without handlers. It's created the same way as the global ``loguru.logger``,
+# but has its own core, so its copies don't share handlers with the application
+_HANDLERS_FREE_LOGGER = Logger(
+    core=Core(),
+    exception=None,
+    depth=0,
+    record=False,
+    lazy=False,
+    colors=False,
+    raw=False,
+    capture=True,
+    patchers=[],
+    extra={},
+)
+
 
 class STDLogger(BaseLogger):
-    """ Implements printing logs to the console. Logger uses `loguru <https://pypi.org/project/loguru/>`_ module """
+    """
+    Implements printing logs to the console. Logger uses `loguru <https://pypi.org/project/loguru/>`_ module.
+    Every logger owns an independent loguru logger, so its records don't reach loguru default handler
+    and sinks of the application, and loggers don't reconfigure each other
+    """
+    structured = True
+
     def __init__(
             self,
             logging_level: str = WarningLevelsEnum.ERROR.value,
             pytz_timezone: str = 'Europe/Moscow',
-            default_formatter: Callable = std_formatter
+            default_formatter: Callable = std_formatter,
+            use_zoneinfo: bool = False,
+            enqueue: bool = False
     ):
         """
         Supported logging levels:
@@ -33,38 +58,52 @@ class STDLogger(BaseLogger):
         :param logging_level: One of the supported logging levels
         :param pytz_timezone: Timezone in string representation
         :param default_formatter: Message text formatter
+        :param use_zoneinfo: If equals ``True`` timezone is resolved by the standard ``zoneinfo`` module
+            instead of ``pytz``
+        :param enqueue: If equals ``True`` records are printed from the loguru background thread
         """
-        self._logger = logger
         self._logging_level = logging_level
         self._default_timezone = pytz_timezone
         self._message_formatter = default_formatter
+        # Default formatter takes exception location from the intercepted event. Custom ones receive strings
+        self._formatter_receives_events = default_formatter is std_formatter
 
         self._check_logging_level()
+        self._timezone = self._resolve_timezone(use_zoneinfo)
+
+        self._logger = copy.deepcopy(_HANDLERS_FREE_LOGGER).patch(self._patch_timezone)
+        self._log = {
+            WarningLevelsEnum.INFO.value: self._logger.info,
+            WarningLevelsEnum.ERROR.value: self._logger.error,
+            WarningLevelsEnum.WARNING.value: self._logger.warning,
+        }[logging_level]
 
-        self._logger.configure(
-            handlers=[
-                {
-                    'sink': sys.stdout,
-                    'format': '{extra[datetime]} | {level} | {message}',
-                },
-            ],
-            patcher=self._patch_timezone
+        self._sink_id = self._logger.add(
+            sys.stdout,
+            format='{extra[datetime]!s} | {level} | {message}',
+            enqueue=enqueue
         )
 
     def save_logs(self, message: str) -> None:
         """ Prints logs to console according to logging level """
-        message = self._message_formatter(message)
-        match self._logging_level:
-            case WarningLevelsEnum.INFO.value:
-                self._logger.info(message)
-            case WarningLevelsEnum.ERROR.value:
-                self._logger.error(message)
-            case WarningLevelsEnum.WARNING.value:
-                self._logger.warning(message)
+        self._log(self._message_formatter(message if self._formatter_receives_events else str(message)))
+
+    def close(self) -> None:
+        """ Removes the logger's sink. Waits for enqueued records """
+        self._logger.remove(self._sink_id)
 
     def _patch_timezone(self, record):
         """ Loguru default timezone patcher  """
-        record['extra']['datetime'] = datetime.now(tz=pytz.timezone(self._default_timezone))
+        record['extra']['datetime'] = record['time'].astimezone(self._timezone)
+
+    def _resolve_timezone(self, use_zoneinfo: bool) -> tzinfo:
+        """ Resolves timezone once for all records """
+        try:
+            if use_zoneinfo:
+                return ZoneInfo(self._default_timezone)
+            return pytz.timezone(self._default_timezone)
+        except (pytz.UnknownTimeZoneError, ZoneInfoNotFoundError, ValueError):
+            raise InterceptItSetupException(f'Encountered unsupported timezone: {self._default_timezone}')
 
     def _check_logging_level(self) -> None:
         """ Checks if invalid logging level received """
@@ -74,3 +113,4 @@ class STDLogger(BaseLogger):
             WarningLevelsEnum.WARNING.value
         ):
             raise InterceptItSetupException(f'Encountered unsupported logging level: {self._logging_level}')
+
@@ -4,3 +4,22 @@ from intercept_it.utils.default_handlers import (
     cooldown_handler,
     async_cooldown_handler,
 )
+
+from intercept_it.utils.backoff_strategies import (
+    BaseBackoff,
+    FixedBackoff,
+    LinearBackoff,
+    FibonacciBackoff,
+    ExponentialBackoff,
+    DecorrelatedJitterBackoff,
+)
+
+from intercept_it.utils.scheduling import set_shared_executor
+
+from intercept_it.utils.rate_limiting import EventsLimiter
+
+from intercept_it.utils.metrics import InterceptorMetrics, render_prometheus
+
+from intercept_it.utils.background_tasks import BackgroundTasks
+
+from intercept_it.utils.instrumentation import intercept_class, intercept_module
@@ -0,0 +1,132 @@
+import sys
+import asyncio
+import traceback
+from typing import Callable, Coroutine
+
+from intercept_it.utils.enums import OverflowPoliciesEnum
+from intercept_it.utils.exceptions import InterceptItSetupException
+
+
+class BackgroundTasks:
+    """
+    Executes coroutine functions as background tasks, so the caller doesn't wait for them.
+    Keeps strong references to the tasks until they are finished.
+
+    Supported overflow policies for the full pool:
+
+    * BLOCK - Waits for a free place in the pool
+    * DROP_NEWEST - Drops the received coroutine function
+    * DROP_OLDEST - Cancels the oldest task, which hasn't started yet
+    """
+    def __init__(
+            self,
+            max_concurrency: int = 100,
+            max_pending: int = 1000,
+            overflow_policy: str = OverflowPoliciesEnum.DROP_NEWEST.value
+    ):
+        """
+        :param max_concurrency: Maximum count of the tasks executed at the same time
+        :param max_pending: Maximum count of the unfinished tasks, including the executed ones
+        :param overflow_policy: One of the supported overflow policies
+        """
+        self._max_concurrency = max_concurrency
+        self._max_pending = max_pending
+        self._overflow_policy = overflow_policy
+        self._check_parameters()
+
+        self._concurrency = asyncio.Semaphore(max_concurrency)
+        self._slots = asyncio.Semaphore(max_pending)
+        self._tasks: set[asyncio.Task] = set()
+        # Tasks waiting for the concurrency semaphore in the creation order
+        self._waiting: dict[asyncio.Task, None] = {}
+        self._closed = False
+
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        """ Count of the unfinished tasks """
+        return len(self._tasks)
+
+    async def submit(self, coroutine_function: Callable[..., Coroutine], *args, **kwargs) -> bool:
+        """
+        Schedules coroutine function execution according to overflow policy
+
+        :param coroutine_function: Coroutine function
+        :param args: Positional arguments of the function
+        :param kwargs: Keyword arguments of the function
+        :return: ``False`` if the coroutine function was dropped
+        """
+        if self._closed:
+            self.dropped += 1
+            return False
+
+        if self._slots.locked():
+            match self._overflow_policy:
+                case OverflowPoliciesEnum.DROP_NEWEST.value:
+                    self.dropped += 1
+                    return False
+                case OverflowPoliciesEnum.DROP_OLDEST.value:
+                    if not self._waiting:
+                        self.dropped += 1
+                        return False
+                    oldest = next(iter(self._waiting))
+                    del self._waiting[oldest]
+                    oldest.cancel()
+                    self.dropped += 1
+
+        await self._slots.acquire()
+        if self._closed:
+            self._slots.release()
+            self.dropped += 1
+            return False
+
+        task = asyncio.get_running_loop().create_task(self._execute(coroutine_function, args, kwargs))
+        self._tasks.add(task)
+        self._waiting[task] = None
+        task.add_done_callback(self._forget)
+        return True
+
+    async def aclose(self, timeout: int | float | None = None) -> None:
+        """
+        Stops receiving new coroutine functions and waits for the scheduled tasks
+
+        :param timeout: Time in seconds, after which unfinished tasks are cancelled. If not specified, waits forever
+        """
+        self._closed = True
+        if not self._tasks:
+            return
+
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+
+    async def _execute(self, coroutine_function: Callable[..., Coroutine], args: tuple, kwargs: dict) -> None:
+        async with self._concurrency:
+            self._waiting.pop(asyncio.current_task(), None)
+            try:
+                await coroutine_function(*args, **kwargs)
+            except Exception:
+                self.failed += 1
+                traceback.print_exc(file=sys.stderr)
+
+    def _forget(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        self._waiting.pop(task, None)
+        self._slots.release()
+
+    def _check_parameters(self) -> None:
+        """ Checks if invalid pool parameters received """
+        for name, value in (('max_concurrency', self._max_concurrency), ('max_pending', self._max_pending)):
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise InterceptItSetupException(f'Wrong value {value!r} for {name}. Expected positive int')
+
+        if self._overflow_policy not in (
+            OverflowPoliciesEnum.BLOCK.value,
+            OverflowPoliciesEnum.DROP_NEWEST.value,
+            OverflowPoliciesEnum.DROP_OLDEST.value
+        ):
+            raise InterceptItSetupException(f'Encountered unsupported overflow policy: {self._overflow_policy}')
@@ -0,0 +1,145 @@
+import random
+import itertools
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+from intercept_it.utils.exceptions import InterceptItSetupException
+
+
+class BaseBackoff(ABC):
+    """
+    Backoff strategy interface. Generates delays between attempts of the wrapped function.
+    Capped strategies stop growing the delay after the cap, so endless retries don't overflow it
+    """
+    @abstractmethod
+    def delays(self) -> Iterator[float]:
+        """ Returns the infinite iterator of delays in seconds. Is called once for every retried call """
+        pass
+
+    @staticmethod
+    def _check_delays(**delays: int | float | None) -> None:
+        for name, value in delays.items():
+            if value is None:
+                continue
+            if not isinstance(value, int | float) or isinstance(value, bool) or value < 0:
+                raise InterceptItSetupException(
+                    f'Wrong value {value!r} for "{name}" parameter. Expected non-negative int, float'
+                )
+
+    @staticmethod
+    def _check_initial_delay(initial: int | float) -> None:
+        """ Multiplicative strategies can't grow the zero delay, so retries would never wait """
+        if initial <= 0:
+            raise InterceptItSetupException(
+                f'Wrong value {initial!r} for "initial" parameter. Expected positive int, float'
+            )
+
+
+class FixedBackoff(BaseBackoff):
+    """ Waits the same time before every attempt """
+    def __init__(self, timeout: int | float = 1):
+        """
+        :param timeout: Delay in seconds
+        """
+        self._check_delays(timeout=timeout)
+        self._timeout = timeout
+
+    def delays(self) -> Iterator[float]:
+        return itertools.repeat(self._timeout)
+
+
+class LinearBackoff(BaseBackoff):
+    """ Increases delay by the same step after every attempt """
+    def __init__(self, initial: int | float = 1, step: int | float = 1, max_delay: int | float | None = None):
+        """
+        :param initial: First delay in seconds
+        :param step: Delay increment in seconds
+        :param max_delay: Delay cap in seconds. If not specified, delay grows endlessly
+        """
+        self._check_delays(initial=initial, step=step, max_delay=max_delay)
+        self._initial = initial
+        self._step = step
+        self._max_delay = max_delay
+
+    def delays(self) -> Iterator[float]:
+        delay = self._initial
+        while True:
+            yield delay if self._max_delay is None else min(delay, self._max_delay)
+            if self._max_delay is None or delay < self._max_delay:
+                delay += self._step
+
+
+class FibonacciBackoff(BaseBackoff):
+    """ Delays follow Fibonacci sequence: initial, initial, 2 * initial, 3 * initial, 5 * initial... """
+    def __init__(self, initial: int | float = 1, max_delay: int | float | None = 60):
+        """
+        :param initial: First positive delay in seconds
+        :param max_delay: Delay cap in seconds. If not specified, delay grows endlessly
+        """
+        self._check_delays(initial=initial, max_delay=max_delay)
+        self._check_initial_delay(initial)
+        self._initial = initial
+        self._max_delay = max_delay
+
+    def delays(self) -> Iterator[float]:
+        previous, current = 0, self._initial
+        while True:
+            yield current if self._max_delay is None else min(current, self._max_delay)
+            if self._max_delay is None or current < self._max_delay:
+                previous, current = current, previous + current
+
+
+class ExponentialBackoff(BaseBackoff):
+    """
+    Multiplies delay by the factor after every attempt.
+    With full jitter the random delay between zero and the exponential one is chosen
+    """
+    def __init__(
+            self,
+            initial: int | float = 1,
+            factor: int | float = 2,
+            max_delay: int | float | None = 60,
+            full_jitter: bool = False
+    ):
+        """
+        :param initial: First positive delay in seconds
+        :param factor: Delay multiplier, not less than 1
+        :param max_delay: Delay cap in seconds. If not specified, delay grows endlessly
+        :param full_jitter: If equals ``True`` every delay is randomized from zero to the exponential delay
+        """
+        self._check_delays(initial=initial, factor=factor, max_delay=max_delay)
+        self._check_initial_delay(initial)
+        if factor < 1:
+            raise InterceptItSetupException(f'Wrong value {factor!r} for "factor" parameter. Expected int, float >= 1')
+        self._initial = initial
+        self._factor = factor
+        self._max_delay = max_delay
+        self._full_jitter = full_jitter
+
+    def delays(self) -> Iterator[float]:
+        delay = self._initial
+        while True:
+            capped_delay = delay if self._max_delay is None else min(delay, self._max_delay)
+            yield random.uniform(0, capped_delay) if self._full_jitter else capped_delay
+
+            if self._max_delay is None or delay < self._max_delay:
+                delay *= self._factor
+
+
+class DecorrelatedJitterBackoff(BaseBackoff):
+    """ Every delay is randomized from the initial one to the tripled previous delay """
+    def __init__(self, initial: int | float = 1, max_delay: int | float = 60):
+        """
+        :param initial: Minimal positive delay in seconds
+        :param max_delay: Delay cap in seconds
+        """
+        self._check_delays(initial=initial, max_delay=max_delay)
+        self._check_initial_delay(initial)
+        self._initial = initial
+        self._max_delay = max_delay
+
+    def delays(self) -> Iterator[float]:
+        delay = self._initial
+        while True:
+            delay = min(self._max_delay, random.uniform(self._initial, delay * 3))
+            yield delay
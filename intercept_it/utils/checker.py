@@ -1,8 +1,13 @@
-import inspect
+from types import FunctionType, MethodType, ModuleType
 from typing import Callable, Any
+from concurrent.futures import Executor
 
 from intercept_it.utils.exceptions import InterceptItSetupException, InterceptItRunTimeException
 from intercept_it.loggers.base_logger import BaseLogger
+from intercept_it.utils.backoff_strategies import BaseBackoff
+from intercept_it.utils.rate_limiting import EventsLimiter
+from intercept_it.utils.metrics import InterceptorMetrics
+from intercept_it.utils.background_tasks import BackgroundTasks
 
 
 class ArgumentsChecker:
@@ -11,16 +16,31 @@ class ArgumentsChecker:
 
     * InterceptItSetupException when interceptor receives invalid parameters during initialization
     * InterceptItRunTimeException when interceptor receives invalid parameters at runtime
+
+    Runtime checks can be disabled by the production mode, when all interceptors usages are already validated
     """
+    def __init__(self):
+        self.production_mode = False
+
+    def set_production_mode(self, enabled: bool = True) -> None:
+        """
+        Switches runtime checks of the ``wrap`` methods off or on
+
+        :param enabled: If equals ``True`` wrapped functions, exceptions and group ids won't be checked at runtime
+        """
+        self.check_boolean_arguments({'enabled': enabled})
+        self.production_mode = enabled
+
     def check_setup_parameters(
             self,
             loggers: list[BaseLogger] | None = None,
             exceptions: list[type[BaseException]] | None = None,
             raise_exception: bool = False,
             greed_mode: bool = False,
-            async_mode: bool = False,
+            async_mode: bool | None = None,
             fast_handlers_execution: bool = False,
-            fast_loggers_execution: bool = False
+            fast_loggers_execution: bool = False,
+            subclass_matching: bool = False
     ) -> None:
         self.check_exceptions(exceptions)
         self.check_loggers(loggers)
@@ -29,11 +49,13 @@ class ArgumentsChecker:
             {
                 'raise_exception': raise_exception,
                 'greed_mode': greed_mode,
-                'async_mode': async_mode,
                 'fast_handlers_execution': fast_handlers_execution,
-                'fast_loggers_execution': fast_loggers_execution
+                'fast_loggers_execution': fast_loggers_execution,
+                'subclass_matching': subclass_matching
             }
         )
+        if async_mode is not None:
+            self.check_boolean_arguments({'async_mode': async_mode})
 
     def check_nested_interceptors(
             self,
@@ -64,18 +86,22 @@ class ArgumentsChecker:
                 )
 
     @staticmethod
-    def check_exceptions(exceptions: list[type[BaseException]] | None) -> None:
+    def check_exceptions(exceptions: list[type[BaseException]] | tuple[type[BaseException], ...] | None) -> None:
+        """ Checks if all of received exceptions are ``BaseException`` subclasses without instantiating them """
         if exceptions:
             for exception in exceptions:
-                try:
-                    if not isinstance(exception(), BaseException):
-                        raise InterceptItSetupException(
-                            f'Received wrong exception object: {exception.__class__}'
-                        )
-                except TypeError:
-                    raise InterceptItSetupException(
-                        f'Received wrong exception object: {exception.__class__}'
-                    )
+                if not isinstance(exception, type) or not issubclass(exception, BaseException):
+                    raise InterceptItSetupException(f'Received wrong exception object: {exception}')
+
+    def check_exceptions_filter(self, exceptions: list[type[BaseException]] | None) -> None:
+        """ Checks if the exceptions filter of the handler or logger is a non-empty collection of exceptions """
+        if exceptions is None:
+            return
+        if not isinstance(exceptions, list | tuple) or not exceptions:
+            raise InterceptItSetupException(
+                f'Wrong exceptions filter: {exceptions!r}. Expected non-empty list of exceptions'
+            )
+        self.check_exceptions(exceptions)
 
     @staticmethod
     def check_loggers(loggers: list[BaseLogger] | None) -> None:
@@ -92,6 +118,73 @@ class ArgumentsChecker:
         if not isinstance(timeout, int) and not isinstance(timeout, float):
             raise InterceptItSetupException(f'Wrong type {type(timeout)} for timeout parameter. Expected int, float')
 
+    @staticmethod
+    def check_backoff(backoff: BaseBackoff | None) -> None:
+        if backoff is not None and not isinstance(backoff, BaseBackoff):
+            raise InterceptItSetupException(
+                f'Wrong backoff strategy: {backoff.__class__.__name__}. It must implements BaseBackoff class'
+            )
+
+    @staticmethod
+    def check_events_limiter(limiter: EventsLimiter | None) -> None:
+        if limiter is not None and not isinstance(limiter, EventsLimiter):
+            raise InterceptItSetupException(
+                f'Wrong events limiter: {limiter.__class__.__name__}. Expected EventsLimiter'
+            )
+
+    @staticmethod
+    def check_metrics(metrics: InterceptorMetrics | None) -> None:
+        if metrics is not None and not isinstance(metrics, InterceptorMetrics):
+            raise InterceptItSetupException(
+                f'Wrong metrics collector: {metrics.__class__.__name__}. Expected InterceptorMetrics'
+            )
+
+    @staticmethod
+    def check_executor(executor: Executor | None) -> None:
+        if executor is not None and not isinstance(executor, Executor):
+            raise InterceptItSetupException(f'Wrong executor: {executor.__class__.__name__}. Expected Executor')
+
+    @staticmethod
+    def check_background_tasks(background_tasks: BackgroundTasks | None) -> None:
+        if background_tasks is not None and not isinstance(background_tasks, BackgroundTasks):
+            raise InterceptItSetupException(
+                f'Wrong background tasks pool: {background_tasks.__class__.__name__}. Expected BackgroundTasks'
+            )
+
+    @staticmethod
+    def check_execution_timeout(timeout: int | float | None) -> None:
+        if timeout is not None and (
+                not isinstance(timeout, int | float) or isinstance(timeout, bool) or timeout <= 0
+        ):
+            raise InterceptItSetupException(f'Wrong value {timeout!r} for timeout. Expected positive int, float')
+
+    @staticmethod
+    def check_retries_limits(max_attempts: int | None, deadline: int | float | None) -> None:
+        if max_attempts is not None and (
+                not isinstance(max_attempts, int) or isinstance(max_attempts, bool) or max_attempts < 1
+        ):
+            raise InterceptItSetupException(f'Wrong value {max_attempts!r} for max_attempts. Expected positive int')
+
+        if deadline is not None and (
+                not isinstance(deadline, int | float) or isinstance(deadline, bool) or deadline <= 0
+        ):
+            raise InterceptItSetupException(f'Wrong value {deadline!r} for deadline. Expected positive int, float')
+
+    @staticmethod
+    def check_circuit_breaker_parameters(
+            failure_threshold: int,
+            window: int | float,
+            recovery_timeout: int | float,
+            half_open_max_calls: int
+    ) -> None:
+        for name, value in {'failure_threshold': failure_threshold, 'half_open_max_calls': half_open_max_calls}.items():
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise InterceptItSetupException(f'Wrong value {value!r} for {name}. Expected positive int')
+
+        for name, value in {'window': window, 'recovery_timeout': recovery_timeout}.items():
+            if not isinstance(value, int | float) or isinstance(value, bool) or value <= 0:
+                raise InterceptItSetupException(f'Wrong value {value!r} for {name}. Expected positive int, float')
+
     @staticmethod
     def check_boolean_arguments(arguments: dict[str, bool]) -> None:
         for name, value in arguments.items():
@@ -100,18 +193,36 @@ class ArgumentsChecker:
 
     @staticmethod
     def check_function(function: Callable) -> None:
+        """ Checks if the function or the bound method received, including static, class and async methods """
         if not function:
             raise InterceptItRunTimeException('Target function not specified')
-        # TODO: Протестировать на методах класса
-        if not inspect.isfunction(function):
+        if not isinstance(function, (FunctionType, MethodType)):
             raise InterceptItRunTimeException(f'Received invalid function: {function}')
 
+    @staticmethod
+    def check_instrumentation_parameters(
+            target: type | ModuleType,
+            decorator: Callable[[Callable], Callable],
+            include: list[str] | None,
+            exclude: list[str] | None
+    ) -> None:
+        """ Checks the target and parameters of the bulk instrumentation """
+        if not isinstance(target, type | ModuleType):
+            raise InterceptItSetupException(f'Wrong instrumentation target: {target!r}. Expected class or module')
+        if not callable(decorator):
+            raise InterceptItSetupException(f'Wrong decorator: {decorator!r}. Expected callable')
+        for name, patterns in (('include', include), ('exclude', exclude)):
+            if patterns is not None and (
+                    not isinstance(patterns, list | tuple) or not all(isinstance(pattern, str) for pattern in patterns)
+            ):
+                raise InterceptItSetupException(f'Wrong value {patterns!r} for {name}. Expected list of str')
+
     @staticmethod
     def check_group_existence(
             group_id: int | str | type[BaseException],
             interceptors: dict[int | str | type[BaseException], Any]
     ) -> None:
-        if not interceptors.get(group_id):
+        if group_id not in interceptors:
             raise InterceptItRunTimeException(f'Received invalid group_id: {group_id}')
 
 
@@ -1,12 +1,39 @@
-import traceback
+import sys
+from functools import lru_cache
+from types import CodeType, FrameType, TracebackType
 
+from intercept_it.utils.models import InterceptedEvent
 
-def std_formatter(message: str) -> str:
+
+def std_formatter(message: str | InterceptedEvent) -> str:
     """
-    Adds information about path and line when exception occurred
+    Adds information about path and line when exception occurred.
+    The location is taken from the exception traceback, so the whole stack isn't extracted
 
-    :param message: Exception message
+    :param message: Exception message or intercepted event
     :return: Formated exception message
     """
-    traceback_message = traceback.format_list(traceback.extract_stack())[0].split(', in')[0].strip()
-    return f"{traceback_message}: {message}"
+    if isinstance(message, InterceptedEvent):
+        location = _traceback_location(message.exception.__traceback__)
+    else:
+        location = _traceback_location(sys.exc_info()[2]) or _frame_location(sys._getframe(1))
+    return f"{location}: {message}"
+
+
+def _traceback_location(traceback: TracebackType | None) -> str | None:
+    """ Returns the location of the innermost traceback frame, where exception was raised """
+    if traceback is None:
+        return None
+
+    while traceback.tb_next is not None:
+        traceback = traceback.tb_next
+    return _format_location(traceback.tb_frame.f_code, traceback.tb_lineno)
+
+
+def _frame_location(frame: FrameType) -> str:
+    return _format_location(frame.f_code, frame.f_lineno)
+
+
+@lru_cache(maxsize=4096)
+def _format_location(code: CodeType, line_number: int) -> str:
+    return f'File "{code.co_filename}", line {line_number}'
@@ -4,7 +4,8 @@ import asyncio
 
 def cooldown_handler(waiting_time_in_seconds: int) -> None:
     """
-    Select time delay after exception handling. Program will sleep at the specified time
+    Select time delay after exception handling. Program will sleep at the specified time.
+    The handler blocks the thread, so use backoff strategies in non-blocking ``LoopedInterceptor`` instead
 
     :param waiting_time_in_seconds: Time dilation value in seconds
     """
@@ -5,3 +5,21 @@ class WarningLevelsEnum(Enum):
     INFO = 'INFO'
     WARNING = 'WARNING'
     ERROR = 'ERROR'
+
+
+class OverflowPoliciesEnum(Enum):
+    BLOCK = 'BLOCK'
+    DROP_NEWEST = 'DROP_NEWEST'
+    DROP_OLDEST = 'DROP_OLDEST'
+
+
+class FunctionKindsEnum(Enum):
+    FUNCTION = 'FUNCTION'
+    COROUTINE_FUNCTION = 'COROUTINE_FUNCTION'
+    ASYNC_GENERATOR_FUNCTION = 'ASYNC_GENERATOR_FUNCTION'
+
+
+class CircuitStatesEnum(Enum):
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+    HALF_OPEN = 'HALF_OPEN'
@@ -6,3 +6,8 @@ class InterceptItRunTimeException(Exception):
 class InterceptItSetupException(Exception):
     """ Exception raises during interceptor initialization """
     pass
+
+
+class InterceptItCircuitOpenException(InterceptItRunTimeException):
+    """ Exception raises when the circuit breaker rejects the call """
+    pass
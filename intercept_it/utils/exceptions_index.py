@@ -0,0 +1,49 @@
+from typing import Any, Callable
+
+
+class ExceptionsIndex(dict):
+    """
+    Cache of resolved exception classes. Maps any caught exception class to the matched target exception
+    or ``None`` if the class doesn't match any of the targets.
+
+    In the exact matching mode only the target classes themselves are matched.
+    In the subclass matching mode the nearest target along the class MRO is matched
+    """
+    def __init__(self, exceptions: list[type[BaseException]] | None, subclass_matching: bool = False):
+        """
+        :param exceptions: Collection of target exceptions
+        :param subclass_matching: If equals ``True`` subclasses of the target exceptions are matched too
+        """
+        targets = tuple(dict.fromkeys(exceptions or ()))
+        super().__init__((target, target) for target in targets)
+
+        self.targets = targets
+        self.subclass_matching = subclass_matching
+
+    def __missing__(self, exception_class: type[BaseException]) -> type[BaseException] | None:
+        """ Resolves the class met for the first time and caches the result """
+        target = None
+        if self.subclass_matching:
+            target = next((parent for parent in exception_class.__mro__ if parent in self.targets), None)
+
+        self[exception_class] = target
+        return target
+
+
+class RoutesIndex(dict):
+    """
+    Cache of resolved exception routes. Maps any intercepted exception class to the route,
+    which is compiled for the first exception of this class and reused later
+    """
+    def __init__(self, compile_route: Callable[[type[BaseException]], Any]):
+        """
+        :param compile_route: Function, that receives the exception class and returns its route
+        """
+        super().__init__()
+        self._compile_route = compile_route
+
+    def __missing__(self, exception_class: type[BaseException]) -> Any:
+        """ Resolves the class met for the first time and caches the result """
+        route = self._compile_route(exception_class)
+        self[exception_class] = route
+        return route
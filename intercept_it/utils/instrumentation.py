@@ -0,0 +1,103 @@
+from fnmatch import fnmatchcase
+from functools import update_wrapper
+from types import FunctionType, MethodType, ModuleType
+from typing import Callable
+
+from intercept_it.utils.checker import arguments_checker
+
+# Private and special names aren't wrapped, unless other exclude patterns are specified
+DEFAULT_EXCLUDE = ('_*',)
+
+
+def intercept_class(
+        cls: type,
+        decorator: Callable[[Callable], Callable],
+        include: list[str] | None = None,
+        exclude: list[str] | None = DEFAULT_EXCLUDE
+) -> tuple[str, ...]:
+    """
+    Wraps all matching methods of the class by the decorator in one pass.
+    Ordinary, static, class and async methods are wrapped. Inherited methods are wrapped in their own classes.
+    Methods are replaced only after all of them were decorated, so the class stays untouched if decoration fails
+
+    Usage example::
+
+    intercept_class(UsersRepository, global_interceptor.intercept, exclude=['_*', 'close'])
+
+    :param cls: Target class
+    :param decorator: Decorator of the methods, e.g. ``global_interceptor.intercept``
+        or ``unit_interceptor.intercept(ValueError)``
+    :param include: Shell-style patterns of the wrapped names. If not specified, all names are matched
+    :param exclude: Shell-style patterns of the skipped names. If not specified, private and special names are skipped
+    :return: Names of the wrapped methods
+    """
+    arguments_checker.check_instrumentation_parameters(cls, decorator, include, exclude)
+
+    wrappers = {}
+    for name, attribute in vars(cls).items():
+        if not _is_selected(name, include, exclude):
+            continue
+
+        if isinstance(attribute, staticmethod | classmethod):
+            if isinstance(attribute.__func__, FunctionType):
+                wrappers[name] = attribute.__class__(_decorate(decorator, attribute.__func__))
+        elif isinstance(attribute, FunctionType):
+            wrappers[name] = _decorate(decorator, attribute)
+    return _assign(cls, wrappers)
+
+
+def intercept_module(
+        module: ModuleType,
+        decorator: Callable[[Callable], Callable],
+        include: list[str] | None = None,
+        exclude: list[str] | None = DEFAULT_EXCLUDE
+) -> tuple[str, ...]:
+    """
+    Wraps all matching functions of the module by the decorator in one pass.
+    Only functions and bound methods defined in the module are wrapped, imported ones are skipped.
+    Names imported from the module before the call keep the original functions.
+    Functions are replaced only after all of them were decorated, so the module stays untouched if decoration fails
+
+    Usage example::
+
+    intercept_module(repositories, global_interceptor.intercept, include=['get_*', 'save_*'])
+
+    :param module: Target module
+    :param decorator: Decorator of the functions, e.g. ``global_interceptor.intercept``
+        or ``unit_interceptor.intercept(ValueError)``
+    :param include: Shell-style patterns of the wrapped names. If not specified, all names are matched
+    :param exclude: Shell-style patterns of the skipped names. If not specified, private and special names are skipped
+    :return: Names of the wrapped functions
+    """
+    arguments_checker.check_instrumentation_parameters(module, decorator, include, exclude)
+
+    wrappers = {}
+    for name, attribute in vars(module).items():
+        if not _is_selected(name, include, exclude):
+            continue
+
+        function = attribute.__func__ if isinstance(attribute, MethodType) else attribute
+        if isinstance(function, FunctionType) and function.__module__ == module.__name__:
+            wrappers[name] = _decorate(decorator, attribute)
+    return _assign(module, wrappers)
+
+
+def _is_selected(name: str, include: list[str] | None, exclude: list[str] | None) -> bool:
+    if include is not None and not any(fnmatchcase(name, pattern) for pattern in include):
+        return False
+    return not exclude or not any(fnmatchcase(name, pattern) for pattern in exclude)
+
+
+def _assign(target: type | ModuleType, wrappers: dict[str, Callable]) -> tuple[str, ...]:
+    """ Replaces the attributes only after all of them were decorated, so a failed decoration changes nothing """
+    for name, wrapper in wrappers.items():
+        setattr(target, name, wrapper)
+    return tuple(wrappers)
+
+
+def _decorate(decorator: Callable[[Callable], Callable], function: Callable) -> Callable:
+    """ Wraps the function and copies its name and docstring to the wrapper """
+    wrapper = decorator(function)
+    if isinstance(wrapper, FunctionType) and wrapper is not function:
+        update_wrapper(wrapper, function, updated=())
+    return wrapper
@@ -0,0 +1,227 @@
+import threading
+from bisect import bisect_left
+from typing import Callable, Any
+
+from intercept_it.utils.exceptions import InterceptItSetupException
+
+DEFAULT_DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class DurationHistogram:
+    """ Histogram of the execution durations in seconds with the fixed buckets """
+    def __init__(self, buckets: tuple[int | float, ...] = DEFAULT_DURATION_BUCKETS):
+        """
+        :param buckets: Sorted upper bounds of the buckets. The infinite bucket is added automatically
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, duration: float) -> None:
+        self.counts[bisect_left(self.buckets, duration)] += 1
+        self.sum += duration
+        self.count += 1
+
+    def cumulative_counts(self) -> list[tuple[str, int]]:
+        """ Returns counts of the observations less or equal than every upper bound, as Prometheus expects """
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            total += count
+            result.append((str(bound), total))
+        return result
+
+
+class InterceptorMetrics:
+    """
+    Counters and histograms of the interceptor's work. Collection is opt-in:
+    an interceptor collects metrics only if the object is passed to it.
+
+    * Calls of the wrapped functions
+    * Intercepted exceptions by type
+    * Exceptions sent higher up the call stack
+    * Retries of the ``LoopedInterceptor``
+    * Calls rejected by the ``CircuitBreakerInterceptor``
+    * Loggers and handlers exceeded the timeout
+    * Durations of the loggers and handlers execution
+
+    One object can be shared by several interceptors. Use different names to tell them apart in the exported data
+    """
+    def __init__(self, name: str = 'default', buckets: tuple[int | float, ...] = DEFAULT_DURATION_BUCKETS):
+        """
+        :param name: Name of the interceptor in the exported data
+        :param buckets: Sorted upper bounds in seconds of the duration histograms buckets
+        """
+        if not isinstance(name, str):
+            raise InterceptItSetupException(f'Wrong type for metrics name: {type(name)}. Expected str')
+        if not buckets or list(buckets) != sorted(buckets) or any(
+                not isinstance(bound, int | float) or isinstance(bound, bool) or bound <= 0 for bound in buckets
+        ):
+            raise InterceptItSetupException(f'Wrong duration buckets: {buckets!r}. Expected sorted positive numbers')
+
+        self.name = name
+        self._buckets = tuple(buckets)
+
+        # Single short critical section per update. Cheaper than the atomic counters emulation in pure python
+        self._lock = threading.Lock()
+        self._calls: dict[str, int] = {}
+        self._intercepted: dict[tuple[str, str], int] = {}
+        self._raised: dict[str, int] = {}
+        self._retries: dict[str, int] = {}
+        self._rejected: dict[str, int] = {}
+        self._timeouts: dict[str, int] = {}
+        self._durations = {
+            'loggers': DurationHistogram(self._buckets),
+            'handlers': DurationHistogram(self._buckets),
+        }
+
+    def record_call(self, function: str) -> None:
+        """
+        :param function: Label of the wrapped function, see ``function_label``
+        """
+        self._increment(self._calls, function)
+
+    def record_intercepted(self, function: str, exception: BaseException) -> None:
+        self._increment(self._intercepted, (function, exception.__class__.__name__))
+
+    def record_raised(self, function: str) -> None:
+        self._increment(self._raised, function)
+
+    def record_retry(self, function: str) -> None:
+        self._increment(self._retries, function)
+
+    def record_rejected(self, function: str) -> None:
+        self._increment(self._rejected, function)
+
+    def record_timeout(self, stage: str) -> None:
+        """
+        :param stage: ``loggers`` or ``handlers``
+        """
+        self._increment(self._timeouts, stage)
+
+    def observe_duration(self, stage: str, duration: float) -> None:
+        """
+        :param stage: ``loggers`` or ``handlers``
+        :param duration: Execution time in seconds
+        """
+        with self._lock:
+            self._durations[stage].observe(duration)
+
+    def reset(self) -> None:
+        """ Forgets all collected values """
+        with self._lock:
+            for counters in (
+                    self._calls, self._intercepted, self._raised, self._retries, self._rejected, self._timeouts
+            ):
+                counters.clear()
+            for stage in self._durations:
+                self._durations[stage] = DurationHistogram(self._buckets)
+
+    def snapshot(self) -> dict[str, Any]:
+        """ Returns consistent copy of the collected values """
+        with self._lock:
+            intercepted: dict[str, dict[str, int]] = {}
+            for (function, exception), count in self._intercepted.items():
+                intercepted.setdefault(function, {})[exception] = count
+
+            return {
+                'name': self.name,
+                'calls': dict(self._calls),
+                'intercepted': intercepted,
+                'raised': dict(self._raised),
+                'retries': dict(self._retries),
+                'rejected': dict(self._rejected),
+                'timeouts': dict(self._timeouts),
+                'durations': {
+                    stage: {
+                        'buckets': dict(histogram.cumulative_counts()),
+                        'sum': histogram.sum,
+                        'count': histogram.count,
+                    }
+                    for stage, histogram in self._durations.items()
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        """ Returns collected values in the Prometheus text exposition format """
+        return render_prometheus(self)
+
+    def _increment(self, counters: dict, key: Any) -> None:
+        with self._lock:
+            counters[key] = counters.get(key, 0) + 1
+
+
+def render_prometheus(*collectors: InterceptorMetrics) -> str:
+    """
+    Returns values of several collectors in the Prometheus text exposition format.
+    Every metric is described once, so the output of different interceptors can be served together
+
+    :param collectors: Metrics of the interceptors
+    """
+    snapshots = [collector.snapshot() for collector in collectors]
+    lines = []
+
+    for metric, description in (
+            ('calls', 'Calls of the wrapped functions'),
+            ('raised', 'Exceptions sent higher up the call stack'),
+            ('retries', 'Retries of the wrapped functions'),
+            ('rejected', 'Calls rejected by the open circuit'),
+    ):
+        lines.append(f'# HELP intercept_it_{metric}_total {description}')
+        lines.append(f'# TYPE intercept_it_{metric}_total counter')
+        for snapshot in snapshots:
+            interceptor = _escape(snapshot['name'])
+            for function, count in snapshot[metric].items():
+                lines.append(
+                    f'intercept_it_{metric}_total{{interceptor="{interceptor}",function="{_escape(function)}"}} {count}'
+                )
+
+    lines.append('# HELP intercept_it_intercepted_total Intercepted exceptions')
+    lines.append('# TYPE intercept_it_intercepted_total counter')
+    for snapshot in snapshots:
+        interceptor = _escape(snapshot['name'])
+        for function, exceptions in snapshot['intercepted'].items():
+            for exception, count in exceptions.items():
+                lines.append(
+                    f'intercept_it_intercepted_total{{interceptor="{interceptor}",function="{_escape(function)}",'
+                    f'exception="{_escape(exception)}"}} {count}'
+                )
+
+    lines.append('# HELP intercept_it_timeouts_total Loggers and handlers exceeded the timeout')
+    lines.append('# TYPE intercept_it_timeouts_total counter')
+    for snapshot in snapshots:
+        interceptor = _escape(snapshot['name'])
+        for stage, count in snapshot['timeouts'].items():
+            lines.append(f'intercept_it_timeouts_total{{interceptor="{interceptor}",stage="{stage}"}} {count}')
+
+    for stage in ('loggers', 'handlers'):
+        metric = f'intercept_it_{stage}_duration_seconds'
+        lines.append(f'# HELP {metric} Execution time of the {stage}')
+        lines.append(f'# TYPE {metric} histogram')
+        for snapshot in snapshots:
+            interceptor = _escape(snapshot['name'])
+            histogram = snapshot['durations'][stage]
+            for bound, count in histogram['buckets'].items():
+                lines.append(f'{metric}_bucket{{interceptor="{interceptor}",le="{bound}"}} {count}')
+            lines.append(f'{metric}_sum{{interceptor="{interceptor}"}} {histogram["sum"]}')
+            lines.append(f'{metric}_count{{interceptor="{interceptor}"}} {histogram["count"]}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def function_label(function: Callable) -> str:
+    """
+    Full name of the function, so same-named functions of different modules don't share series.
+    Interceptors compute it once per wrapped function and pass it to the counters
+    """
+    qualname = getattr(function, '__qualname__', None)
+    if qualname is None:
+        return repr(function)
+    module = getattr(function, '__module__', None)
+    return f'{module}.{qualname}' if module else qualname
+
+
+def _escape(value: str) -> str:
+    """ Escapes label value according to the Prometheus text format """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
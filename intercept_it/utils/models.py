@@ -1,13 +1,93 @@
-from typing import Any
-from pydantic import BaseModel
+import time
+from typing import Any, Callable, NamedTuple
 
+from intercept_it.loggers.base_logger import BaseLogger, BaseAsyncLogger
+from intercept_it.utils.rate_limiting import EventsLimiter
+from intercept_it.utils.enums import FunctionKindsEnum
+from intercept_it.utils.exceptions_index import ExceptionsIndex
 
-class DefaultHandler(BaseModel):
-    callable: Any
+
+class DefaultHandler(NamedTuple):
+    """ Immutable record of the registered handler """
+    callable: Callable
+    args: tuple
+    kwargs: dict[str, Any]
     execution_order: int
     receive_parameters: bool
-    args: tuple
-    kwargs: dict
+    limiter: EventsLimiter | None = None
+    is_coroutine_function: bool = False
+    timeout: int | float | None = None
+    exceptions: tuple[type[BaseException], ...] | None = None
+
+
+class DefaultLogger(NamedTuple):
+    """ Immutable record of the registered logger """
+    logger: BaseLogger | BaseAsyncLogger
+    exceptions: tuple[type[BaseException], ...] | None = None
+
+
+class InterceptionLayer(NamedTuple):
+    """ Immutable record of the interceptor applied to the function """
+    interceptor: Any
+    matches: ExceptionsIndex
+    raise_exception: bool
+
+
+class StackedLayers(NamedTuple):
+    """ Interceptors merged into the one wrapper. Layers are stored from the innermost to the outermost """
+    wrapper: Callable
+    function: Callable
+    kind: FunctionKindsEnum
+    layers: tuple[InterceptionLayer, ...]
+
+
+class InterceptedEvent:
+    """
+    Information about the intercepted exception. Is created only when the interceptor has loggers.
+    Message formatting is deferred until the first access and shared by all loggers
+    """
+    __slots__ = ('exception', 'exception_type', 'function', 'timestamp', 'args', 'kwargs', 'suppressed', '_message')
+
+    def __init__(
+            self,
+            exception: BaseException,
+            function: Callable,
+            args: tuple | None = None,
+            kwargs: dict | None = None,
+            suppressed: int = 0
+    ):
+        """
+        :param exception: Intercepted exception
+        :param function: Wrapped function
+        :param args: Positional arguments of the function. Are sent only in the greed mode
+        :param kwargs: Keyword arguments of the function. Are sent only in the greed mode
+        :param suppressed: Count of events of any exception type suppressed by the limiter before this one
+        """
+        self.exception = exception
+        self.exception_type = exception.__class__
+        self.function = function
+        self.timestamp = time.monotonic()
+        self.args = args
+        self.kwargs = kwargs
+        self.suppressed = suppressed
+        self._message: str | None = None
+
+    @property
+    def qualname(self) -> str:
+        """ Qualified name of the wrapped function """
+        return getattr(self.function, '__qualname__', repr(self.function))
+
+    @property
+    def message(self) -> str:
+        """ Exception message. Is formatted once """
+        if self._message is None:
+            self._message = str(self.exception)
+            if self.suppressed:
+                self._message = f'{self._message} ({self.suppressed} events suppressed)'
+        return self._message
+
+    def __str__(self) -> str:
+        return self.message
 
-    def __gt__(self, other) -> bool:
-        return self.execution_order > other.execution_order
+    def __repr__(self) -> str:
+        return f'InterceptedEvent({self.exception_type.__name__} in {self.qualname}: {self.message})'
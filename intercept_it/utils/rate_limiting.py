@@ -0,0 +1,150 @@
+import sys
+import math
+import time
+import random
+import threading
+import traceback
+from typing import Callable
+
+from intercept_it.utils.exceptions import InterceptItSetupException
+from intercept_it.utils.scheduling import shared_executor, shared_scheduler
+
+
+class EventsLimiter:
+    """
+    Limits intercepted events processing by the token bucket and probabilistic sampling.
+    Counts suppressed events, so the next processed event and the periodic reports can report them
+    """
+    def __init__(
+            self,
+            rate: int | float | None = None,
+            burst: int | None = None,
+            sample_rate: int | float = 1,
+            report_interval: int | float | None = None
+    ):
+        """
+        :param rate: Maximum average count of processed events per second. If not specified, rate isn't limited
+        :param burst: Maximum count of events processed at once. If not specified, equals rounded up rate
+        :param sample_rate: Probability of the event processing from 0 to 1. Is applied before the rate limit
+        :param report_interval: Period in seconds of the suppressed events reports. Report is sent
+            after the interval since the first event suppressed after the previous report.
+            If not specified, only the next processed event reports suppressed ones
+        """
+        self._rate = rate
+        self._burst = burst
+        self._sample_rate = sample_rate
+        self._report_interval = report_interval
+        self._check_parameters()
+
+        if self._burst is None:
+            self._burst = math.ceil(rate) if rate is not None else 1
+
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._pending_suppressed = 0
+        self._reporters: tuple[Callable[[int], None], ...] = ()
+        self._report_scheduled = False
+
+        self.processed = 0
+        self.suppressed = 0
+
+    def allow(self) -> bool:
+        """ Checks if the event can be processed """
+        if self._sample_rate < 1 and random.random() >= self._sample_rate:
+            return self._suppress()
+
+        if self._rate is None:
+            self.processed += 1
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens < 1:
+                self._count_suppressed()
+                return False
+
+            self._tokens -= 1
+            self.processed += 1
+            return True
+
+    def pop_suppressed(self) -> int:
+        """ Returns count of events suppressed since the previous call """
+        with self._lock:
+            suppressed, self._pending_suppressed = self._pending_suppressed, 0
+            return suppressed
+
+    def add_reporter(self, reporter: Callable[[int], None]) -> None:
+        """
+        Subscribes the callable to the periodic reports. Interceptors subscribe themselves, when they receive
+        the limiter. Reports are sent only if ``report_interval`` is specified
+
+        :param reporter: Callable, which receives count of the suppressed events
+        """
+        with self._lock:
+            if reporter not in self._reporters:
+                self._reporters = (*self._reporters, reporter)
+
+    def _suppress(self) -> bool:
+        with self._lock:
+            self._count_suppressed()
+        return False
+
+    def _count_suppressed(self) -> None:
+        """ Counts suppressed event and schedules the report, if it isn't scheduled yet. Is called under the lock """
+        self.suppressed += 1
+        self._pending_suppressed += 1
+        if self._report_interval is not None and self._reporters and not self._report_scheduled:
+            self._report_scheduled = True
+            shared_scheduler().schedule(self._report_interval, self._submit_report)
+
+    def _submit_report(self) -> None:
+        """ Scheduler callbacks must be short, so the report is sent by the executor """
+        shared_executor().submit(self._report)
+
+    def _report(self) -> None:
+        """ Sends count of the events suppressed since the previous report, if the processed events didn't do it """
+        with self._lock:
+            self._report_scheduled = False
+            suppressed, self._pending_suppressed = self._pending_suppressed, 0
+            reporters = self._reporters
+
+        if not suppressed:
+            return
+        for reporter in reporters:
+            try:
+                reporter(suppressed)
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+
+    def _check_parameters(self) -> None:
+        """ Checks if invalid limits received """
+        if self._rate is not None and (
+                not isinstance(self._rate, int | float) or isinstance(self._rate, bool) or self._rate <= 0
+        ):
+            raise InterceptItSetupException(f'Wrong value {self._rate!r} for rate. Expected positive int, float')
+
+        if self._burst is not None and (
+                not isinstance(self._burst, int) or isinstance(self._burst, bool) or self._burst < 1
+        ):
+            raise InterceptItSetupException(f'Wrong value {self._burst!r} for burst. Expected positive int')
+
+        if self._report_interval is not None and (
+                not isinstance(self._report_interval, int | float)
+                or isinstance(self._report_interval, bool)
+                or self._report_interval <= 0
+        ):
+            raise InterceptItSetupException(
+                f'Wrong value {self._report_interval!r} for report_interval. Expected positive int, float'
+            )
+
+        if (
+                not isinstance(self._sample_rate, int | float)
+                or isinstance(self._sample_rate, bool)
+                or not 0 < self._sample_rate <= 1
+        ):
+            raise InterceptItSetupException(
+                f'Wrong value {self._sample_rate!r} for sample_rate. Expected int, float from 0 to 1'
+            )
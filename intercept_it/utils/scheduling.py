@@ -0,0 +1,193 @@
+import sys
+import time
+import asyncio
+import contextvars
+import heapq
+import itertools
+import threading
+import traceback
+from functools import partial
+from typing import Callable, Any
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+from intercept_it.utils.exceptions import InterceptItRunTimeException
+
+_shared_executor: Executor | None = None
+_shared_scheduler: 'RetryScheduler | None' = None
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_thread: threading.Thread | None = None
+_lock = threading.Lock()
+
+
+class RetryScheduler:
+    """
+    Runs callbacks after the specified delays from the one daemon thread.
+    Callbacks must be short, e.g. submit the next attempt to the executor
+    """
+    def __init__(self):
+        self._timers: list[tuple[float, int, Callable[[], None]]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def schedule(self, delay: int | float, callback: Callable[[], None]) -> None:
+        """
+        :param delay: Delay in seconds
+        :param callback: Callable without arguments
+        """
+        with self._condition:
+            heapq.heappush(self._timers, (time.monotonic() + delay, next(self._counter), callback))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='intercept-it-retry-scheduler', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._timers:
+                    self._condition.wait()
+
+                due_time, _, callback = self._timers[0]
+                remaining = due_time - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                heapq.heappop(self._timers)
+
+            try:
+                callback()
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+
+
+def shared_scheduler() -> RetryScheduler:
+    """ Returns the scheduler shared by all interceptors """
+    global _shared_scheduler
+    with _lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = RetryScheduler()
+        return _shared_scheduler
+
+
+def shared_executor() -> Executor:
+    """ Returns the executor shared by all interceptors. Is created on the first call """
+    global _shared_executor
+    with _lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(thread_name_prefix='intercept-it')
+        return _shared_executor
+
+
+def set_shared_executor(executor: Executor) -> None:
+    """
+    Replaces the executor shared by all interceptors. Previous executor isn't shut down
+
+    :param executor: Any ``concurrent.futures.Executor`` object
+    """
+    global _shared_executor
+    with _lock:
+        _shared_executor = executor
+
+
+def execute_in_parallel(executor: Executor, calls: list[Callable[[], Any]], wait: bool) -> None:
+    """
+    Executes calls in the executor. Exception of one call doesn't stop others.
+
+    In the waiting mode the first call is executed by the waiting thread. Calls, which the executor hasn't
+    started yet, are taken back and executed by the waiting thread too, so the saturated executor can't
+    block the caller forever. The first exception is raised after all calls are finished.
+
+    In the non-waiting mode exceptions are printed to stderr
+
+    :param executor: Executor of the calls
+    :param calls: Callables without arguments
+    :param wait: If equals ``True`` waits until all calls are finished
+    """
+    if not wait:
+        for call in calls:
+            try:
+                executor.submit(call).add_done_callback(_print_exception)
+            except RuntimeError:
+                # Executor is shut down
+                _execute_isolated(call)
+        return
+
+    pending: list[tuple[Future | None, Callable[[], Any]]] = []
+    for call in calls[1:]:
+        try:
+            pending.append((executor.submit(call), call))
+        except RuntimeError:
+            pending.append((None, call))
+
+    errors = [_execute_isolated(calls[0])]
+    for future, call in pending:
+        if future is None or future.cancel():
+            errors.append(_execute_isolated(call))
+        else:
+            errors.append(future.exception())
+
+    error = next((error for error in errors if error is not None), None)
+    if error is not None:
+        raise error
+
+
+def _execute_isolated(call: Callable[[], Any]) -> Exception | None:
+    try:
+        call()
+    except Exception as exception:
+        return exception
+    return None
+
+
+def _print_exception(future: Future) -> None:
+    if future.cancelled():
+        return
+
+    exception = future.exception()
+    if exception is not None:
+        traceback.print_exception(exception, file=sys.stderr)
+
+
+async def run_in_thread(executor: Executor | None, function: Callable, *args, **kwargs) -> Any:
+    """
+    Executes ordinary function by the executor without blocking the event loop. Context variables are copied
+
+    :param executor: Executor of the function. If equals ``None`` the event loop default executor is used
+    :param function: Ordinary function
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(executor, partial(context.run, function, *args, **kwargs))
+
+
+def background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the event loop shared by the coroutines executed from the ordinary code.
+    The loop runs forever in the daemon thread, which is started on the first call
+    """
+    global _background_loop, _background_thread
+    with _lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            _background_thread = threading.Thread(
+                target=_background_loop.run_forever,
+                name='intercept-it-event-loop',
+                daemon=True
+            )
+            _background_thread.start()
+        return _background_loop
+
+
+def run_coroutine_blocking(coroutine_function: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Executes coroutine function from the ordinary code by the shared background event loop and waits for the result.
+    The same loop serves all calls, so loop-bound resources of the async loggers and handlers survive between them.
+    Exceptions of the coroutine are raised to the caller in any context
+
+    :param coroutine_function: Coroutine function
+    """
+    loop = background_loop()
+    if threading.current_thread() is _background_thread:
+        raise InterceptItRunTimeException('Coroutine can\'t be executed blocking from the background event loop')
+    return asyncio.run_coroutine_threadsafe(coroutine_function(*args, **kwargs), loop).result()
@@ -25,14 +25,10 @@ setup(
         "Typing :: Typed"
     ],
     install_requires=[
-        "annotated-types==0.7.0",
         "colorama==0.4.6",
         "loguru==0.7.2",
-        "pydantic==2.9.2",
-        "pydantic_core==2.23.4",
         "pytz==2024.2",
         "setuptools==75.5.0",
-        "typing_extensions==4.12.2",
         "win32-setctime==1.1.0"
     ]
 )